@@ -5,16 +5,66 @@
 # Requires: pip install pymongo
 
 import os, json, argparse, hashlib, re, math, datetime as dt
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
 from pymongo import MongoClient, UpdateOne, ASCENDING, DESCENDING
 from pymongo.errors import OperationFailure
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
+try:
+    import ijson
+    HAVE_IJSON = True
+except Exception:
+    HAVE_IJSON = False
+
+LOAD_BATCH = 2000
+
 # --------------------------- Utils ---------------------------
 
 def robust_json_load(path: str) -> Any:
+    if HAVE_ORJSON:
+        with open(path, "rb") as f:
+            raw = f.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # json.dump writes NaN/Infinity literals, which orjson rejects
+            return json.loads(raw)
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
+def iter_json_list(path: str, what: str) -> Iterator[Dict[str, Any]]:
+    # Yields the records of a top-level JSON list. With ijson they are streamed off disk,
+    # so a loader holds one upsert batch at a time instead of the whole parsed file.
+    if not HAVE_IJSON:
+        data = robust_json_load(path)
+        if not isinstance(data, list):
+            raise ValueError(f"{what} JSON must be a list.")
+        yield from data
+        return
+    with open(path, "rb") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        if first != b"[":
+            raise ValueError(f"{what} JSON must be a list.")
+        f.seek(0)
+        seen = 0
+        try:
+            for rec in ijson.items(f, "item", use_float=True):
+                yield rec
+                seen += 1
+            return
+        except ijson.JSONError:
+            pass
+    # ijson rejects the NaN/Infinity literals json.dump can write; finish from a full parse
+    yield from robust_json_load(path)[seen:]
+
 def sha1(s: str) -> str:
     return hashlib.sha1(s.encode("utf-8", errors="ignore")).hexdigest()
 
@@ -134,6 +184,20 @@ def upsert_many(coll, docs: List[Dict[str, Any]], chunk=2000):
         if ops:
             coll.bulk_write(ops, ordered=False)
 
+def to_docs(merchant: str, stream: str, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Records come straight from the parsed file and nothing else holds them,
+    # so they are tagged in place rather than copied into a second dict each
+    out = []
+    for rec in records:
+        ts = ts_of_record(stream, rec)
+        doc_key = make_doc_key(merchant, stream, rec)
+        rec["merchant"] = merchant
+        rec["ts"] = ts
+        rec["dt"] = dt.datetime.utcfromtimestamp(ts).isoformat() + "Z" if ts else None
+        rec["doc_key"] = doc_key
+        out.append(rec)
+    return out
+
 # --------------------------- Index management ---------------------------
 
 COMMON_COLL = [
@@ -231,20 +295,9 @@ def ensure_indexes(db, enforce_unique_doc_key=True, try_dedupe=True):
 
 def load_stream_list(db, merchant: str, stream: str, path: str):
     print(f"Loading {stream} for {merchant} from {path}")
-    data = robust_json_load(path)
-    if not isinstance(data, list):
-        raise ValueError(f"{stream} JSON must be a list.")
-    out = []
-    for rec in data:
-        ts = ts_of_record(stream, rec)
-        dt_iso = dt.datetime.utcfromtimestamp(ts).isoformat() + "Z" if ts else None
-        doc = dict(rec)
-        doc.update({"merchant": merchant, "ts": ts, "dt": dt_iso})
-        doc_key = make_doc_key(merchant, stream, rec)
-        doc["doc_key"] = doc_key
-        out.append(doc)
     coll_name = stream if stream != "wl" else "wl_transactions"
-    upsert_many(db[coll_name], out)
+    for recs in chunked(iter_json_list(path, stream), LOAD_BATCH):
+        upsert_many(db[coll_name], to_docs(merchant, stream, recs), chunk=LOAD_BATCH)
 
 def load_stock(db, merchant: str, path: str):
     print(f"Loading stock for {merchant} from {path}")
@@ -261,38 +314,17 @@ def load_stock(db, merchant: str, path: str):
 
     # prices
     prices = data.get("prices") or []
-    docs_p = []
-    for rec in prices:
-        ts = ts_of_record("stocks_prices", rec)
-        dt_iso = dt.datetime.utcfromtimestamp(ts).isoformat() + "Z" if ts else None
-        doc = dict(rec)
-        doc.update({"merchant": merchant, "ts": ts, "dt": dt_iso})
-        doc["doc_key"] = make_doc_key(merchant, "stocks_prices", rec)
-        docs_p.append(doc)
+    docs_p = to_docs(merchant, "stocks_prices", prices)
     upsert_many(db["stocks_prices"], docs_p)
 
     # earnings
     earnings = data.get("earnings") or []
-    docs_e = []
-    for rec in earnings:
-        ts = ts_of_record("stocks_earnings", rec)
-        dt_iso = dt.datetime.utcfromtimestamp(ts).isoformat() + "Z" if ts else None
-        doc = dict(rec)
-        doc.update({"merchant": merchant, "ts": ts, "dt": dt_iso})
-        doc["doc_key"] = make_doc_key(merchant, "stocks_earnings", rec)
-        docs_e.append(doc)
+    docs_e = to_docs(merchant, "stocks_earnings", earnings)
     upsert_many(db["stocks_earnings"], docs_e)
 
     # corporate actions
     actions = data.get("corporate_actions") or []
-    docs_a = []
-    for rec in actions:
-        ts = ts_of_record("stocks_actions", rec)
-        dt_iso = dt.datetime.utcfromtimestamp(ts).isoformat() + "Z" if ts else None
-        doc = dict(rec)
-        doc.update({"merchant": merchant, "ts": ts, "dt": dt_iso})
-        doc["doc_key"] = make_doc_key(merchant, "stocks_actions", rec)
-        docs_a.append(doc)
+    docs_a = to_docs(merchant, "stocks_actions", actions)
     upsert_many(db["stocks_actions"], docs_a)
 
 def load_wl(db, merchant: str, path: str):
@@ -301,14 +333,7 @@ def load_wl(db, merchant: str, path: str):
     txns = data.get("transactions") or data  # allow either {"transactions": [...]} or plain list
     if not isinstance(txns, list):
         raise ValueError("WL JSON must have 'transactions' list or be a list.")
-    out = []
-    for rec in txns:
-        ts = ts_of_record("wl", rec)
-        dt_iso = dt.datetime.utcfromtimestamp(ts).isoformat() + "Z" if ts else None
-        doc = dict(rec)
-        doc.update({"merchant": merchant, "ts": ts, "dt": dt_iso})
-        doc["doc_key"] = make_doc_key(merchant, "wl", rec)
-        out.append(doc)
+    out = to_docs(merchant, "wl", txns)
     upsert_many(db["wl_transactions"], out)
 
 # --------------------------- Main ---------------------------
@@ -319,6 +344,7 @@ def main():
     ap.add_argument("--mongo", default="mongodb://127.0.0.1:27017", help="Mongo URI")
     ap.add_argument("--db", default="merchant_analytics", help="Database name")
     ap.add_argument("--non_unique_doc_key", action="store_true", help="Do not enforce unique doc_key")
+    ap.add_argument("--workers", type=int, default=6, help="Parallel file loads (1 = sequential)")
     args = ap.parse_args()
 
     man = robust_json_load(args.manifest)
@@ -329,23 +355,24 @@ def main():
     # Create merchant+ts indexes first; doc_key unique index will be adjusted after load if needed
     ensure_indexes(db, enforce_unique_doc_key=(not args.non_unique_doc_key), try_dedupe=True)
 
-    for m in merchants:
-        merchant = m.get("merchant")
-        paths = m.get("paths") or {}
-        if not merchant:
-            continue
-        if paths.get("tweets") and os.path.exists(paths["tweets"]):
-            load_stream_list(db, merchant, "tweets", paths["tweets"])
-        if paths.get("reddit") and os.path.exists(paths["reddit"]):
-            load_stream_list(db, merchant, "reddit", paths["reddit"])
-        if paths.get("news") and os.path.exists(paths["news"]):
-            load_stream_list(db, merchant, "news", paths["news"])
-        if paths.get("reviews") and os.path.exists(paths["reviews"]):
-            load_stream_list(db, merchant, "reviews", paths["reviews"])
-        if paths.get("stock") and os.path.exists(paths["stock"]):
-            load_stock(db, merchant, paths["stock"])
-        if paths.get("wl") and os.path.exists(paths["wl"]):
-            load_wl(db, merchant, paths["wl"])
+    # Every (merchant, file) load is independent: different files, and upserts keyed by doc_key.
+    # Run them in a thread pool so file parsing overlaps with Mongo round trips (MongoClient is thread-safe).
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as ex:
+        futs = []
+        for m in merchants:
+            merchant = m.get("merchant")
+            paths = m.get("paths") or {}
+            if not merchant:
+                continue
+            for stream in ("tweets", "reddit", "news", "reviews"):
+                if paths.get(stream) and os.path.exists(paths[stream]):
+                    futs.append(ex.submit(load_stream_list, db, merchant, stream, paths[stream]))
+            if paths.get("stock") and os.path.exists(paths["stock"]):
+                futs.append(ex.submit(load_stock, db, merchant, paths["stock"]))
+            if paths.get("wl") and os.path.exists(paths["wl"]):
+                futs.append(ex.submit(load_wl, db, merchant, paths["wl"]))
+        for fut in futs:
+            fut.result()  # re-raise the first loader failure, as the sequential loop did
 
     # Final pass to enforce unique doc_key (dedupe if required)
     ensure_indexes(db, enforce_unique_doc_key=(not args.non_unique_doc_key), try_dedupe=True)
@@ -3,11 +3,18 @@ import uuid
 import json
 import math
 import re
+from functools import lru_cache
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta, timezone, date
 import numpy as np
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
 
 @dataclass
 class NewsArticle:
@@ -89,9 +96,15 @@ def make_article_id(counter: int) -> str:
     return f"n_{base36(counter)}{uuid.uuid4().hex[:5]}"
 
 
+SLUG_STRIP_RE = re.compile(r"[^\w\s-]", flags=re.UNICODE)
+SLUG_SPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
 def slugify(title: str) -> str:
-    slug = re.sub(r"[^\w\s-]", "", title, flags=re.UNICODE)
-    slug = re.sub(r"\s+", "-", slug.strip()).lower()
+    # Headlines come from template pools (a few hundred distinct per run), so most calls are cache hits
+    slug = SLUG_STRIP_RE.sub("", title)
+    slug = SLUG_SPACE_RE.sub("-", slug.strip()).lower()
     return slug[:80] if slug else "article"
 
 
@@ -852,8 +865,12 @@ def generate_fake_news_json(
         safe = merchant_name.lower().replace(" ", "")
         out_json_path = f"news_{safe}_{start_date}_to_{end_date}_{ts}.json".replace(":", "-")
 
-    with open(out_json_path, "w", encoding="utf-8") as f:
-        json.dump(out_list, f, ensure_ascii=False, indent=2)
+    if HAVE_ORJSON:
+        with open(out_json_path, "wb") as f:
+            f.write(orjson.dumps(out_list, option=orjson.OPT_INDENT_2))
+    else:
+        with open(out_json_path, "w", encoding="utf-8") as f:
+            json.dump(out_list, f, ensure_ascii=False, indent=2)
 
     return out_json_path
 
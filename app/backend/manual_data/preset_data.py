@@ -3,7 +3,34 @@ import json
 import argparse
 import random
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
+# Trend label pools and the keyword tags used to classify them
+POS_LABELS = ("spike - new product launch", "feature rollout", "award", "partnership", "buyback", "expansion")
+NEG_LABELS = ("spike - data breach", "lawsuit", "outage", "recall", "regulatory fine", "scandal")
+NEU_LABELS = ("normal", "promo period", "seasonal buzz")
+NEG_TAGS = frozenset({"breach", "lawsuit", "outage", "recall", "fine", "scandal"})
+POS_TAGS = frozenset({"launch", "award", "partnership", "buyback", "expansion"})
+
+# Stock volatility / volume multipliers per label category, as stock_data.parse_multiplier reads them
+STOCK_VOL_NEG = (1.4, 1.6, 1.4, 1.6)
+STOCK_VOLM_NEG = (1.6, 2.0, 2.8)
+STOCK_VOL_POS = (1.2, 1.4, 1.2, 1.4)
+STOCK_VOLM_POS = (1.3, 1.6, 2.5)
+STOCK_VOL_NEU = (1.1, 1.1, 1.0)
+STOCK_VOLM_NEU = (1.1, 2.1, 1.0)
+
+# Trend fields holding a share (fraction of the stream) or a multiplier
+SHARE_KEYS = ("posts", "articles", "reviews", "transactions")
+MULT_KEYS = ("volatility", "volume")
+STREAM_KEYS = ("tweets", "reddit", "news", "reviews", "stock", "wl")
 
 
 def slugify(text: str) -> str:
@@ -11,48 +38,54 @@ def slugify(text: str) -> str:
 
 
 def random_ticker(name: str) -> str:
-    letters = "".join([c for c in (name or "").upper() if c.isalpha()])
-    if len(letters) >= 3:
-        return letters[:3]
+    letters = []
+    for c in (name or "").upper():
+        if c.isalpha():
+            letters.append(c)
+            if len(letters) == 3:
+                return "".join(letters)
     return "MRC"
 
 
-def random_trend_plan(start: str, end: str, rng: random.Random, n_min=3, n_max=5) -> List[Dict[str, Any]]:
-    from datetime import date
-    def parse_month(s):
-        y, m, *_ = s.split("-")
-        return date(int(y), int(m), 1)
-    s = parse_month(start)
-    e = parse_month(end)
+def parse_ym(s: str) -> Tuple[int, int]:
+    y, m, *_ = s.split("-")
+    return int(y), int(m)
+
+
+@lru_cache(maxsize=None)
+def months_between(start_ym: Tuple[int, int], end_ym: Tuple[int, int]) -> Tuple[str, ...]:
+    (cur_y, cur_m), (end_y, end_m) = start_ym, end_ym
     months = []
-    cur_y, cur_m = s.year, s.month
-    while (cur_y < e.year) or (cur_y == e.year and cur_m <= e.month):
+    while (cur_y < end_y) or (cur_y == end_y and cur_m <= end_m):
         months.append(f"{cur_y}-{cur_m:02d}")
         cur_m += 1
         if cur_m > 12:
             cur_m = 1
             cur_y += 1
+    return tuple(months)
+
+
+def random_trend_plan(bounds: Tuple[Tuple[int, int], Tuple[int, int]], rng: random.Random, n_min=3, n_max=5) -> List[Dict[str, Any]]:
+    months = months_between(*bounds)
     if not months:
         return []
     k = rng.randint(n_min, min(n_max, max(3, len(months))))
-    picks = sorted(rng.sample(range(len(months)), k=k))
-    pos_labels = ["spike - new product launch", "feature rollout", "award", "partnership", "buyback", "expansion"]
-    neg_labels = ["spike - data breach", "lawsuit", "outage", "recall", "regulatory fine", "scandal"]
-    neu_labels = ["normal", "promo period", "seasonal buzz"]
+    picks = rng.sample(range(len(months)), k=k)
+    picks.sort()
     plan = []
     for idx in picks:
         m = months[idx]
         r = rng.random()
         if r < 0.35:
-            label = rng.choice(neg_labels); intensity = rng.uniform(0.65, 0.95)
+            label = rng.choice(NEG_LABELS); intensity = rng.uniform(0.65, 0.95)
         elif r < 0.70:
-            label = rng.choice(pos_labels); intensity = rng.uniform(0.55, 0.90)
+            label = rng.choice(POS_LABELS); intensity = rng.uniform(0.55, 0.90)
         else:
-            label = rng.choice(neu_labels); intensity = rng.uniform(0.45, 0.70)
+            label = rng.choice(NEU_LABELS); intensity = rng.uniform(0.45, 0.70)
         item = {"month": m, "intensity": round(float(intensity), 2), "label": label}
         # For content-heavy sources, sometimes set share
         if rng.random() < 0.6:
-            item["posts"] = f"{rng.randint(2,15)}%"
+            item["posts"] = rng.randint(2, 15) / 100
         plan.append(item)
     return plan
 
@@ -64,7 +97,7 @@ def core_to_stream_trends(core: List[Dict[str, Any]], rng: random.Random) -> Dic
         for e in core:
             ee = copy.deepcopy(e)
             if rng.random() < 0.6:
-                ee[key] = f"{rng.randint(lo, hi)}%"
+                ee[key] = rng.randint(lo, hi) / 100
             else:
                 ee.pop("posts", None)
             out.append(ee)
@@ -75,18 +108,18 @@ def core_to_stream_trends(core: List[Dict[str, Any]], rng: random.Random) -> Dic
         for e in core:
             ee = {k: e[k] for k in ("month", "intensity", "label")}
             lab = ee["label"].lower()
-            if any(k in lab for k in ["breach", "lawsuit", "outage", "recall", "fine", "scandal"]):
-                ret = random.uniform(-0.15, -0.05)
-                vol = random.choice(["+40%", "+60%", "1.4x", "1.6x"])
-                volm = random.choice(["x1.6", "x2.0", "180%"])
-            elif any(k in lab for k in ["launch", "award", "partnership", "buyback", "expansion"]):
-                ret = random.uniform(0.04, 0.14)
-                vol = random.choice(["+20%", "+40%", "1.2x", "1.4x"])
-                volm = random.choice(["x1.3", "x1.6", "150%"])
+            if any(k in lab for k in NEG_TAGS):
+                ret = rng.uniform(-0.15, -0.05)
+                vol = rng.choice(STOCK_VOL_NEG)
+                volm = rng.choice(STOCK_VOLM_NEG)
+            elif any(k in lab for k in POS_TAGS):
+                ret = rng.uniform(0.04, 0.14)
+                vol = rng.choice(STOCK_VOL_POS)
+                volm = rng.choice(STOCK_VOLM_POS)
             else:
-                ret = random.uniform(-0.01, 0.02)
-                vol = random.choice(["+10%", "1.1x", "1.0x"])
-                volm = random.choice(["x1.1", "110%", "x1.0"])
+                ret = rng.uniform(-0.01, 0.02)
+                vol = rng.choice(STOCK_VOL_NEU)
+                volm = rng.choice(STOCK_VOLM_NEU)
             ee["return"] = round(float(ret), 3)
             ee["volatility"] = vol
             ee["volume"] = volm
@@ -99,23 +132,23 @@ def core_to_stream_trends(core: List[Dict[str, Any]], rng: random.Random) -> Dic
             ee = {k: e[k] for k in ("month", "intensity", "label")}
             # Optionally attach per-month transaction share
             if rng.random() < 0.6:
-                ee["transactions"] = f"{rng.randint(2, 20)}%"
+                ee["transactions"] = rng.randint(2, 20) / 100
             lab = ee["label"].lower()
-            if any(k in lab for k in ["breach", "lawsuit", "scandal", "outage", "recall", "fine"]):
-                ee["high_risk_intensity"] = round(random.uniform(0.30, 0.70), 3)
-                ee["decline_rate"] = round(random.uniform(0.15, 0.35), 3) if rng.random() < 0.6 else None
+            if any(k in lab for k in NEG_TAGS):
+                ee["high_risk_intensity"] = round(rng.uniform(0.30, 0.70), 3)
+                ee["decline_rate"] = round(rng.uniform(0.15, 0.35), 3) if rng.random() < 0.6 else None
                 if rng.random() < 0.5:
-                    ee["gambling_share"] = round(random.uniform(0.04, 0.15), 3)
-            elif any(k in lab for k in ["launch","award","partnership","buyback","expansion"]):
-                ee["high_risk_intensity"] = round(random.uniform(0.05, 0.15), 3)
-                ee["decline_rate"] = round(random.uniform(0.02, 0.08), 3) if rng.random() < 0.4 else None
+                    ee["gambling_share"] = round(rng.uniform(0.04, 0.15), 3)
+            elif any(k in lab for k in POS_TAGS):
+                ee["high_risk_intensity"] = round(rng.uniform(0.05, 0.15), 3)
+                ee["decline_rate"] = round(rng.uniform(0.02, 0.08), 3) if rng.random() < 0.4 else None
                 if rng.random() < 0.4:
-                    ee["gambling_share"] = round(random.uniform(0.02, 0.08), 3)
+                    ee["gambling_share"] = round(rng.uniform(0.02, 0.08), 3)
             else:
-                ee["high_risk_intensity"] = round(random.uniform(0.08, 0.22), 3)
-                ee["decline_rate"] = round(random.uniform(0.05, 0.12), 3) if rng.random() < 0.5 else None
+                ee["high_risk_intensity"] = round(rng.uniform(0.08, 0.22), 3)
+                ee["decline_rate"] = round(rng.uniform(0.05, 0.12), 3) if rng.random() < 0.5 else None
                 if rng.random() < 0.5:
-                    ee["gambling_share"] = round(random.uniform(0.03, 0.12), 3)
+                    ee["gambling_share"] = round(rng.uniform(0.03, 0.12), 3)
             out.append(ee)
         return out
 
@@ -129,10 +162,13 @@ def core_to_stream_trends(core: List[Dict[str, Any]], rng: random.Random) -> Dic
     }
 
 
-def random_merchant_block(name: str, start_date: str, end_date: str, rng: random.Random) -> Dict[str, Any]:
+def random_merchant_block(name: str, start_date: str, end_date: str, rng: random.Random,
+                          bounds: Optional[Tuple[Tuple[int, int], Tuple[int, int]]] = None) -> Dict[str, Any]:
     slug = slugify(name)
     ticker = random_ticker(name)
-    core = random_trend_plan(start_date[:7], end_date[:7], rng)
+    if bounds is None:
+        bounds = (parse_ym(start_date), parse_ym(end_date))
+    core = random_trend_plan(bounds, rng)
     tr = core_to_stream_trends(core, rng)
 
     tweets_n = rng.randint(5000, 20000)
@@ -154,7 +190,7 @@ def random_merchant_block(name: str, start_date: str, end_date: str, rng: random
         "merchant_name": name,
         "start_date": start_date,
         "end_date": end_date,
-        "seed": rng.randint(1, 10_000_000),
+        "seed": rng.getrandbits(24) or 1,
         "tweets": {
             "enabled": True,
             "n_tweets": tweets_n,
@@ -196,17 +232,47 @@ def random_merchant_block(name: str, start_date: str, end_date: str, rng: random
 
 
 def merge_custom_into_random(random_block: Dict[str, Any], custom_block: Dict[str, Any]) -> Dict[str, Any]:
-    out = dict(random_block)
-    for key, val in custom_block.items():
-        if key in ("tweets", "reddit", "news", "reviews", "stock", "wl") and isinstance(val, dict):
-            merged = dict(random_block.get(key, {}))
-            merged.update(val)
-            out[key] = merged
-        else:
-            out[key] = val
+    out = random_block | custom_block
+    # Stream blocks are merged one level deep so partial overrides keep the random fields
+    for key in STREAM_KEYS:
+        val = custom_block.get(key)
+        if isinstance(val, dict):
+            out[key] = random_block.get(key, {}) | val
+    return out
+
+
+def dump_json_bytes(obj: Any) -> bytes:
+    if HAVE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def format_legacy(block: Dict[str, Any]) -> Dict[str, Any]:
+    # Older consumers expect "12%" shares and "x1.6" multipliers in trend plans
+    def fmt(e: Dict[str, Any]) -> Dict[str, Any]:
+        ee = dict(e)
+        for k in SHARE_KEYS:
+            if isinstance(ee.get(k), float):
+                ee[k] = f"{round(ee[k] * 100)}%"
+        for k in MULT_KEYS:
+            if isinstance(ee.get(k), float):
+                ee[k] = f"x{ee[k]:g}"
+        return ee
+    out = dict(block)
+    for key in STREAM_KEYS:
+        sb = out.get(key)
+        if isinstance(sb, dict) and isinstance(sb.get("trend_plan"), list):
+            out[key] = sb | {"trend_plan": [fmt(e) for e in sb["trend_plan"]]}
     return out
 
 
+def write_all(fd: int, payload: bytes) -> None:
+    # Hand each buffer straight to the fd instead of json.dump's many small writes
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view):]
+
+
 def main():
     ap = argparse.ArgumentParser(description="Build a data_preset.json for merchants.")
     ap.add_argument("--num", type=int, required=True, help="Number of merchants to generate.")
@@ -216,12 +282,11 @@ def main():
     ap.add_argument("--custom", action="append", default=None, help="Path to a JSON file with a custom merchant block (can repeat).")
     ap.add_argument("--merchant_name", default=None, help="Quick custom merchant name (optional).")
     ap.add_argument("--seed", type=int, default=777, help="Base RNG seed for reproducibility.")
+    ap.add_argument("--legacy-strings", action="store_true", help="Write trend shares/multipliers as strings (\"12%%\", \"x1.6\").")
     args = ap.parse_args()
 
     rng = random.Random(args.seed)
 
-    merchants: List[Dict[str, Any]] = []
-
     base_names = [
         "HomeGear", "BuildPro", "BrightLite", "GardenCore", "FixItCo", "ToolNest",
         "ApexDIY", "PrimeHome", "HandyMart", "CraftWorks", "ValueFix", "MegaBuild",
@@ -253,27 +318,27 @@ def main():
         used_names.add(name)
         return name
 
-    for _ in range(count_needed):
-        nm = next_name()
-        block = random_merchant_block(nm, args.start_date, args.end_date, rng)
-        merchants.append(block)
-
+    # Names are fixed up front so customs can be routed to their merchant before it is written.
+    # Unmatched or unnamed customs fold into merchant 0 as before; with --num 0 the first one
+    # becomes a merchant of its own instead of raising IndexError.
+    bounds = (parse_ym(args.start_date), parse_ym(args.end_date))
+    names = [next_name() for _ in range(count_needed)]
+    cur_names = list(names)
+    customs_by_idx: Dict[int, List[Dict[str, Any]]] = {}
     for c in customs:
         cname = c.get("merchant_name") or next_name()
-        idx = None
-        for i, m in enumerate(merchants):
-            if m["merchant_name"].lower() == cname.lower():
-                idx = i
-                break
+        idx = next((i for i, nm in enumerate(cur_names) if nm.lower() == cname.lower()), None)
         if idx is None:
+            if not names:
+                names.append(cname)
+                cur_names.append(cname)
+                used_names.add(cname)
             idx = 0
-        merged = merge_custom_into_random(merchants[idx], c)
-        merged["start_date"] = merged.get("start_date", args.start_date)
-        merged["end_date"] = merged.get("end_date", args.end_date)
-        merged["merchant_name"] = merged.get("merchant_name", merchants[idx]["merchant_name"])
-        merchants[idx] = merged
+        if c.get("merchant_name"):
+            cur_names[idx] = c["merchant_name"]
+        customs_by_idx.setdefault(idx, []).append(c)
 
-    preset = {
+    head = dump_json_bytes({
         "global": {
             "start_date": args.start_date,
             "end_date": args.end_date,
@@ -282,11 +347,27 @@ def main():
                 "wl": {"n_transactions": 50000}
             },
         },
-        "merchants": merchants
-    }
-
-    with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(preset, f, ensure_ascii=False, indent=2)
+    })
+
+    # Merchants are streamed one at a time so peak memory stays at a single block
+    fd = os.open(args.out, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        write_all(fd, head[:head.rindex(b"}")].rstrip() + b',\n  "merchants": [')
+        for i, nm in enumerate(names):
+            block = random_merchant_block(nm, args.start_date, args.end_date, rng, bounds)
+            for c in customs_by_idx.get(i, ()):
+                merged = merge_custom_into_random(block, c)
+                merged["start_date"] = merged.get("start_date", args.start_date)
+                merged["end_date"] = merged.get("end_date", args.end_date)
+                merged["merchant_name"] = merged.get("merchant_name", block["merchant_name"])
+                block = merged
+            if args.legacy_strings:
+                block = format_legacy(block)
+            sep = b",\n    " if i else b"\n    "
+            write_all(fd, sep + dump_json_bytes(block).replace(b"\n", b"\n    "))
+        write_all(fd, b"\n  ]\n}" if names else b"]\n}")
+    finally:
+        os.close(fd)
     print("Saved preset to:", os.path.abspath(args.out))
 
 
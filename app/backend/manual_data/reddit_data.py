@@ -1,15 +1,21 @@
 import random
-import uuid
 import json
-import math
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta, timezone, date
 import numpy as np
 import re
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
 
-@dataclass
+
+@dataclass(slots=True)
 class RedditPost:
     id: str                          # base36-like id (e.g., "abc123")
     name: str                        # fullname ("t3_<id>")
@@ -47,8 +53,23 @@ class RedditPost:
     edited: Optional[Any] = None  # False or int timestamp
 
 
+REDDIT_POST_FIELDS = tuple(f.name for f in fields(RedditPost))
+
+
+def post_to_dict(p: RedditPost) -> Dict[str, Any]:
+    # Shallow field copy; asdict() would deep-copy every value
+    return {name: getattr(p, name) for name in REDDIT_POST_FIELDS}
+
+
 # --------------------------- Utilities ---------------------------
 
+KEYWORD_TOKEN_RE = re.compile(r"[a-z0-9\$]{3,}")
+KEYWORD_STOPWORDS = frozenset([
+    "the", "and", "for", "with", "this", "that", "are", "was", "but", "you", "any", "about", "into", "from",
+    "your", "have", "has", "what", "who", "why", "how", "when", "where", "their", "them", "they", "she", "he",
+    "its", "it's", "had", "were", "will", "would", "could", "should", "just", "new"
+])
+
 def parse_date_str(s: str) -> date:
     if len(s) == 7:
         return date.fromisoformat(s + "-01")
@@ -77,42 +98,79 @@ def base36(n: int) -> str:
     return "".join(reversed(out))
 
 
+BASE36_CHARS = np.frombuffer(b"0123456789abcdefghijklmnopqrstuvwxyz", dtype="S1")
+
+
+def base36_array(values: Any) -> List[str]:
+    # Vectorized base36 for non-negative ints: one divmod pass per digit over the whole array
+    n = np.asarray(values, dtype=np.int64)
+    if n.size == 0:
+        return []
+    width = 1
+    top = int(n.max())
+    while 36 ** width <= top:
+        width += 1
+    digits = np.empty((n.size, width), dtype="S1")
+    for i in range(width - 1, -1, -1):
+        n, r = np.divmod(n, 36)
+        digits[:, i] = BASE36_CHARS[r]
+    out = np.char.lstrip(digits.view(f"S{width}").ravel(), b"0")
+    return np.where(out == b"", b"0", out).astype(str).tolist()
+
+
 def clamp(v: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, v))
 
 
-def make_post_id(counter: int) -> str:
-    # Make increasing-looking base36 id with some randomness
-    return f"{base36(counter)}{uuid.uuid4().hex[:3]}"
+def random_hex(np_rng: np.random.Generator, n: int, width: int) -> List[str]:
+    # n random hex strings of the given width, cut from one batched byte draw
+    step = (width + 1) // 2 * 2
+    blob = np_rng.bytes(n * step // 2).hex()
+    return [blob[k:k + width] for k in range(0, n * step, step)]
+
+
+def make_post_id(counter_b36: str, suffix: str) -> str:
+    # Make increasing-looking base36 id with some randomness (suffix is 3 random hex chars)
+    return f"{counter_b36}{suffix}"
 
 
-def make_subreddit_id() -> str:
-    return f"t5_{base36(random.getrandbits(40))}"
+def make_subreddit_id(bits_b36: str) -> str:
+    return f"t5_{bits_b36}"
 
 
-def make_author_ids() -> Tuple[str, str, str]:
-    uhex = uuid.uuid4().hex[:10]
+def make_author_ids(uhex: str, bits_b36: str) -> Tuple[str, str, str]:
     author_id = f"u_{uhex}"
-    author_fullname = f"t2_{base36(random.getrandbits(40))}"
+    author_fullname = f"t2_{bits_b36}"
     username = f"user_{uhex[:6]}"
     return author_id, author_fullname, username
 
 
+SLUG_STRIP_RE = re.compile(r"[^\w\s-]", flags=re.UNICODE)
+SLUG_SPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
 def slugify(title: str) -> str:
-    slug = re.sub(r"[^\w\s-]", "", title, flags=re.UNICODE)
-    slug = re.sub(r"\s+", "-", slug.strip()).lower()
+    # Titles come from small template pools, so nearly every call is a cache hit
+    slug = SLUG_STRIP_RE.sub("", title)
+    slug = SLUG_SPACE_RE.sub("-", slug.strip()).lower()
     return slug[:60] if slug else "post"
 
 
 # --------------------------- Trend/Events modeling ---------------------------
 
+EVENT_NEG_KEYS = ["breach", "fraud", "lawsuit", "boycott", "downtime", "outage", "recall", "regulatory", "fine", "leak", "crisis", "scandal", "layoff"]
+EVENT_POS_KEYS = ["new product", "launch", "award", "partnership", "expansion", "feature", "investment", "earnings beat", "milestone", "hiring"]
+# One alternation per polarity instead of a substring scan per keyword
+EVENT_NEG_RE = re.compile("|".join(map(re.escape, EVENT_NEG_KEYS)))
+EVENT_POS_RE = re.compile("|".join(map(re.escape, EVENT_POS_KEYS)))
+
+
 def event_sentiment_shift(label: str, rng: random.Random) -> float:
     l = label.lower()
-    neg_keys = ["breach", "fraud", "lawsuit", "boycott", "downtime", "outage", "recall", "regulatory", "fine", "leak", "crisis", "scandal", "layoff"]
-    pos_keys = ["new product", "launch", "award", "partnership", "expansion", "feature", "investment", "earnings beat", "milestone", "hiring"]
-    if any(k in l for k in neg_keys):
+    if EVENT_NEG_RE.search(l):
         return rng.uniform(-0.9, -0.6)
-    if any(k in l for k in pos_keys):
+    if EVENT_POS_RE.search(l):
         return rng.uniform(0.4, 0.8)
     return rng.uniform(-0.05, 0.05)
 
@@ -155,7 +213,7 @@ def build_daily_intensity(
     end: date,
     trend_plan: List[Dict[str, Any]],
     rng: random.Random
-) -> Tuple[List[date], np.ndarray, Dict[date, List[Dict[str, Any]]]]:
+) -> Tuple[List[date], np.ndarray, Tuple[np.ndarray, np.ndarray, List[Optional[str]]]]:
     days = list(dt_range(start, end))
     n = len(days)
     day_of_week = np.array([d.weekday() for d in days], dtype=float)
@@ -168,27 +226,33 @@ def build_daily_intensity(
     intensity = base + weekly + annual
     intensity = np.clip(intensity, 0.1, None)
 
-    events_by_day: Dict[date, List[Dict[str, Any]]] = {d: [] for d in days}
-    for e in trend_plan:
-        e_month = parse_date_str(e["month"])
-        e_center = date(e_month.year, e_month.month, 15)
-        e_intensity = float(e.get("intensity", 0.6))
-        e_label = str(e.get("label", "normal"))
-        sigma_days = rng.randint(7, 24)
-        diffs = np.array([(d - e_center).days for d in days], dtype=float)
-        gaussian = np.exp(-(diffs ** 2) / (2 * (sigma_days ** 2)))
-        intensity += e_intensity * gaussian * 1.25
-        e_shift = event_sentiment_shift(e_label, rng)
-        for idx, d in enumerate(days):
-            if gaussian[idx] > 0.05:
-                events_by_day[d].append({
-                    "label": e_label,
-                    "gaussian": float(gaussian[idx]),
-                    "shift": e_shift
-                })
+    drivers = (np.zeros(n), np.zeros(n), [None] * n)
+    if trend_plan:
+        # Per-event parameters (drawn in plan order to keep the RNG sequence stable)
+        centers = np.empty(len(trend_plan))
+        sigmas = np.empty(len(trend_plan))
+        e_intensities = np.empty(len(trend_plan))
+        e_labels: List[str] = []
+        e_shifts: List[float] = []
+        for k, e in enumerate(trend_plan):
+            e_month = parse_date_str(e["month"])
+            centers[k] = (date(e_month.year, e_month.month, 15) - start).days
+            e_intensities[k] = float(e.get("intensity", 0.6))
+            e_labels.append(str(e.get("label", "normal")))
+            sigmas[k] = rng.randint(7, 24)
+            e_shifts.append(event_sentiment_shift(e_labels[-1], rng))
+
+        # One (days x events) Gaussian kernel matrix instead of a pass per event
+        diffs = np.arange(n, dtype=float)[:, None] - centers[None, :]
+        gaussian = np.exp(-(diffs ** 2) / (2 * sigmas[None, :] ** 2))
+        intensity += (gaussian * e_intensities[None, :]).sum(axis=1) * 1.25
+
+        # Only events with a noticeable kernel on a given day drive that day's sentiment
+        active = np.where(gaussian > 0.05, gaussian, 0.0)
+        drivers = day_sentiment_drivers(active, np.array(e_shifts), e_labels)
 
     intensity = np.clip(intensity, 0.05, None)
-    return days, intensity, events_by_day
+    return days, intensity, drivers
 
 
 def parse_posts_share(val) -> Optional[float]:
@@ -238,35 +302,33 @@ def apply_monthly_post_shares(
             month_shares[k] = month_shares[k] / sum_shares * 0.95
         sum_shares = sum(month_shares.values())
 
-    # Compute base totals by month
-    months = [f"{d.year}-{d.month:02d}" for d in days]
-    unique_months = list(dict.fromkeys(months))
-    month_to_total = {m: 0.0 for m in unique_months}
-    for w, m in zip(base_weights, months):
-        month_to_total[m] += float(w)
-
-    # Compute total weight for "other" months
-    specified_months = set(month_shares.keys())
-    other_total = sum(w for w, m in zip(base_weights, months) if m not in specified_months)
+    # Group days by integer month index (year * 12 + month), via a datetime64 month cast
+    month_keys = np.array(days, dtype="datetime64[M]").astype(np.int64) + (1970 * 12 + 1)
+    uniq, inv = np.unique(month_keys, return_inverse=True)
+    month_to_total = np.bincount(inv, weights=base_weights, minlength=len(uniq))
+    month_pos = {k: i for i, k in enumerate(uniq.tolist())}
+    share_per_month = np.zeros(len(uniq))
+    for m, share in month_shares.items():
+        try:
+            md = parse_date_str(m)
+        except ValueError:
+            continue
+        k = month_pos.get(md.year * 12 + md.month)
+        if k is not None:
+            share_per_month[k] = share
+
+    # Days in specified months get that month's share (preserving daily relative shape);
+    # the remaining share is spread over all other days
+    specified = share_per_month[inv] > 0
+    day_totals = month_to_total[inv]
+    other_total = float(base_weights[~specified].sum())
     remaining_share = max(1e-9, 1.0 - sum_shares)
 
-    # Reassign weights month-wise preserving daily relative shape
     new_w = np.zeros_like(base_weights)
-    # Specified months
-    for m, share in month_shares.items():
-        if m not in month_to_total or month_to_total[m] == 0:
-            continue
-        # Distribute 'share' across days of month m proportional to base weight
-        denom = month_to_total[m]
-        for i, dm in enumerate(months):
-            if dm == m:
-                new_w[i] = base_weights[i] / denom * share
-
-    # Other months
-    if other_total > 0 and remaining_share > 0:
-        for i, dm in enumerate(months):
-            if dm not in specified_months:
-                new_w[i] = base_weights[i] / other_total * remaining_share
+    spec_ok = specified & (day_totals > 0)
+    new_w[spec_ok] = base_weights[spec_ok] / day_totals[spec_ok] * share_per_month[inv][spec_ok]
+    if other_total > 0:
+        new_w[~specified] = base_weights[~specified] / other_total * remaining_share
 
     # Normalize to sum 1
     s = float(new_w.sum())
@@ -277,68 +339,80 @@ def apply_monthly_post_shares(
 
 # --------------------------- Subreddit and content ---------------------------
 
-def choose_subreddit(event_label: Optional[str], rng: random.Random) -> Tuple[str, str, str]:
-    # Returns subreddit name, subreddit_id, flair_text
-    base = [
-        ("news", 0.9), ("worldnews", 0.5), ("business", 0.8), ("technology", 0.9),
-        ("investing", 0.6), ("stocks", 0.6), ("UKInvesting", 0.4),
-        ("netsec", 0.3), ("cybersecurity", 0.35), ("privacy", 0.2),
-        ("DIY", 0.4), ("HomeImprovement", 0.45),
-        ("AskUK", 0.5), ("unitedkingdom", 0.5),
-        ("retail", 0.35), ("CustomerService", 0.25)
-    ]
-    # Bias by event
-    if event_label:
-        el = event_label.lower()
-        if any(k in el for k in ["breach", "outage", "leak", "security", "cyber"]):
-            for i, (s, w) in enumerate(base):
-                if s in ("netsec", "cybersecurity", "technology", "news"):
-                    base[i] = (s, w * 2.0)
-        if any(k in el for k in ["launch", "product", "feature"]):
-            for i, (s, w) in enumerate(base):
-                if s in ("technology", "DIY", "HomeImprovement", "news"):
-                    base[i] = (s, w * 1.8)
-        if any(k in el for k in ["earnings", "investment", "partnership", "award", "regulatory", "fine"]):
-            for i, (s, w) in enumerate(base):
-                if s in ("investing", "stocks", "business", "news"):
-                    base[i] = (s, w * 1.8)
-
-    names = [f"r/{s}" for s, _ in base]
-    weights = np.array([w for _, w in base], dtype=float)
-    weights = weights / weights.sum()
-    idx = int(rng.choices(range(len(names)), weights=weights, k=1)[0])
-    subreddit = names[idx]
-    flair_pool = {
-        "r/news": ["News", "Breaking", "Business"],
-        "r/worldnews": ["News", "Global"],
-        "r/business": ["Discussion", "News", "Earnings"],
-        "r/technology": ["Tech News", "Product", "Discussion"],
-        "r/investing": ["DD", "News", "Discussion"],
-        "r/stocks": ["DD", "News", "Earnings"],
-        "r/UKInvesting": ["Discussion", "News"],
-        "r/netsec": ["Security", "Incident"],
-        "r/cybersecurity": ["Security", "Incident", "Discussion"],
-        "r/privacy": ["Privacy", "Discussion"],
-        "r/DIY": ["Help", "Project", "Discussion"],
-        "r/HomeImprovement": ["Help", "Project", "Advice"],
-        "r/AskUK": ["Question", "Advice"],
-        "r/unitedkingdom": ["News", "Discussion"],
-        "r/retail": ["News", "Discussion"],
-        "r/CustomerService": ["Question", "Complaint"],
-    }
-    flair_choices = flair_pool.get(subreddit, ["Discussion"])
-    flair_text = rng.choice(flair_choices)
-    return subreddit, make_subreddit_id(), flair_text
-
-
-def build_title_and_text(
-    merchant: str,
-    sentiment_label: str,
-    event_label: Optional[str],
-    subreddit: str,
-    rng: random.Random
-) -> Tuple[str, Optional[str]]:
-    m = merchant
+SUBREDDIT_BASE = (
+    ("news", 0.9), ("worldnews", 0.5), ("business", 0.8), ("technology", 0.9),
+    ("investing", 0.6), ("stocks", 0.6), ("UKInvesting", 0.4),
+    ("netsec", 0.3), ("cybersecurity", 0.35), ("privacy", 0.2),
+    ("DIY", 0.4), ("HomeImprovement", 0.45),
+    ("AskUK", 0.5), ("unitedkingdom", 0.5),
+    ("retail", 0.35), ("CustomerService", 0.25)
+)
+SUBREDDIT_NAMES = tuple(f"r/{s}" for s, _ in SUBREDDIT_BASE)
+
+# Event biases: (label keywords, boosted subreddits, weight multiplier); each is one bit of the bucket code
+SUBREDDIT_BIASES = (
+    (("breach", "outage", "leak", "security", "cyber"), ("netsec", "cybersecurity", "technology", "news"), 2.0),
+    (("launch", "product", "feature"), ("technology", "DIY", "HomeImprovement", "news"), 1.8),
+    (("earnings", "investment", "partnership", "award", "regulatory", "fine"), ("investing", "stocks", "business", "news"), 1.8),
+)
+
+
+def _subreddit_cdfs() -> np.ndarray:
+    # One normalized CDF row per bias combination (2 ** len(SUBREDDIT_BIASES) rows)
+    rows = []
+    for code in range(2 ** len(SUBREDDIT_BIASES)):
+        weights = np.array([w for _, w in SUBREDDIT_BASE], dtype=float)
+        for bit, (_, subs, mult) in enumerate(SUBREDDIT_BIASES):
+            if code & (1 << bit):
+                weights *= np.array([mult if s in subs else 1.0 for s, _ in SUBREDDIT_BASE])
+        rows.append(np.cumsum(weights / weights.sum()))
+    return np.array(rows)
+
+
+SUBREDDIT_CDFS = _subreddit_cdfs()
+
+FLAIR_POOL = {
+    "r/news": ["News", "Breaking", "Business"],
+    "r/worldnews": ["News", "Global"],
+    "r/business": ["Discussion", "News", "Earnings"],
+    "r/technology": ["Tech News", "Product", "Discussion"],
+    "r/investing": ["DD", "News", "Discussion"],
+    "r/stocks": ["DD", "News", "Earnings"],
+    "r/UKInvesting": ["Discussion", "News"],
+    "r/netsec": ["Security", "Incident"],
+    "r/cybersecurity": ["Security", "Incident", "Discussion"],
+    "r/privacy": ["Privacy", "Discussion"],
+    "r/DIY": ["Help", "Project", "Discussion"],
+    "r/HomeImprovement": ["Help", "Project", "Advice"],
+    "r/AskUK": ["Question", "Advice"],
+    "r/unitedkingdom": ["News", "Discussion"],
+    "r/retail": ["News", "Discussion"],
+    "r/CustomerService": ["Question", "Complaint"],
+}
+
+
+def subreddit_bucket(event_label: Optional[str]) -> int:
+    # Bias bucket code for an event label (0 = unbiased)
+    if not event_label:
+        return 0
+    el = event_label.lower()
+    code = 0
+    for bit, (keys, _, _) in enumerate(SUBREDDIT_BIASES):
+        if any(k in el for k in keys):
+            code |= 1 << bit
+    return code
+
+
+def choose_subreddits(buckets: np.ndarray, np_rng: np.random.Generator) -> np.ndarray:
+    # Vectorized inverse-CDF draw of a subreddit index per post
+    u = np_rng.random(len(buckets))
+    idx = (SUBREDDIT_CDFS[buckets] < u[:, None]).sum(axis=1)
+    return np.minimum(idx, len(SUBREDDIT_NAMES) - 1)
+
+
+@lru_cache(maxsize=1024)
+def title_pools(merchant: str, event_label: Optional[str], subreddit: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    # Positive/neutral/negative title pools with the merchant already substituted
     # Title templates by sentiment
     pos = [
         "{m} launches new product line — looks promising",
@@ -398,12 +472,28 @@ def build_title_and_text(
         neu += ["What’s your thesis on {m}?"]
         neg += ["Bear case on {m} after recent news"]
 
+    m = merchant
+    return (
+        tuple(t.format(m=m) for t in pos),
+        tuple(t.format(m=m) for t in neu),
+        tuple(t.format(m=m) for t in neg),
+    )
+
+
+def build_title_and_text(
+    merchant: str,
+    sentiment_label: str,
+    event_label: Optional[str],
+    subreddit: str,
+    rng: random.Random
+) -> Tuple[str, Optional[str]]:
+    pos, neu, neg = title_pools(merchant, event_label, subreddit)
     if sentiment_label == "positive":
-        title = rng.choice(pos).format(m=m)
+        title = rng.choice(pos)
     elif sentiment_label == "negative":
-        title = rng.choice(neg).format(m=m)
+        title = rng.choice(neg)
     else:
-        title = rng.choice(neu).format(m=m)
+        title = rng.choice(neu)
 
     # Selftext: sometimes empty (link posts) or short body
     bodies_pos = [
@@ -439,90 +529,249 @@ def build_title_and_text(
 
 
 def extract_keywords(text: str, extra: Optional[str] = None, merchant: Optional[str] = None) -> List[str]:
-    stop = set(["the", "and", "for", "with", "this", "that", "are", "was", "but", "you", "any", "about", "into", "from", "your", "have", "has", "what", "who", "why", "how", "when", "where", "their", "them", "they", "she", "he", "its", "it's", "had", "were", "will", "would", "could", "should", "just", "new"])
-    raw = (text or "") + " " + (extra or "")
-    raw = raw.lower()
-    tokens = re.findall(r"[a-z0-9\$]{3,}", raw)
-    toks = []
-    for t in tokens:
-        if t in stop:
-            continue
-        toks.append(t)
+    raw = ((text or "") + " " + (extra or "")).lower()
+    # dict keeps first-seen order, so this dedups in one pass
+    uniq = dict.fromkeys(t for t in KEYWORD_TOKEN_RE.findall(raw) if t not in KEYWORD_STOPWORDS)
     # ensure merchant token present sometimes
     if merchant:
-        mt = merchant.lower().replace(" ", "")
-        if mt not in toks:
-            toks.append(mt)
+        uniq.setdefault(merchant.lower().replace(" ", ""), None)
     # keep up to 10 unique
-    uniq = []
-    for t in toks:
-        if t not in uniq:
-            uniq.append(t)
-        if len(uniq) >= 10:
-            break
-    return uniq
+    return list(uniq)[:10]
 
 
 # --------------------------- Sentiment/Risk ---------------------------
 
-def compute_sentiment_and_risk(base_mu: float, day_events: List[Dict[str, Any]], rng: random.Random) -> Tuple[float, str, float, Optional[str]]:
-    shift = 0.0
-    driver_event = None
-    if day_events:
-        weights = np.array([e["gaussian"] for e in day_events], dtype=float)
-        weights = weights / (weights.sum() + 1e-12)
-        shift = float(sum(w * e["shift"] for w, e in zip(weights, day_events)))
-        driver_event = max(day_events, key=lambda e: e["gaussian"])["label"]
-    mu = clamp(base_mu + shift, -0.95, 0.95)
-    score = clamp(rng.gauss(mu, 0.45), -1.0, 1.0)
-    if score <= -0.2:
-        label = "negative"
-    elif score >= 0.2:
-        label = "positive"
-    else:
-        label = "neutral"
-    risk = round(100.0 * (1.0 - (score + 1.0) / 2.0), 2)
-    return score, label, risk, driver_event
+def day_sentiment_drivers(
+    active: np.ndarray,
+    shifts: np.ndarray,
+    labels: List[str]
+) -> Tuple[np.ndarray, np.ndarray, List[Optional[str]]]:
+    # Per-day aggregates over a (days x events) kernel matrix, zero where an event is inactive:
+    # gaussian-weighted sentiment shift, event intensity and the dominant event label
+    totals = active.sum(axis=1)
+    day_shift = (active * shifts[None, :]).sum(axis=1) / (totals + 1e-12)
+    day_event_intensity = (active * np.abs(shifts)[None, :]).sum(axis=1)
+    dominant = np.argmax(active, axis=1)
+    day_driver = [labels[k] if t > 0 else None for k, t in zip(dominant.tolist(), totals.tolist())]
+    return day_shift, day_event_intensity, day_driver
+
+
+def compute_sentiment_and_risk(mu: np.ndarray, np_rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Vectorized over posts: mu holds each post's (already clamped) sentiment mean
+    scores = np.clip(np_rng.normal(mu, 0.45), -1.0, 1.0)
+    labels = np.select([scores <= -0.2, scores >= 0.2], ["negative", "positive"], "neutral")
+    risks = np.round(100.0 * (1.0 - (scores + 1.0) / 2.0), 2)
+    return scores, labels, risks
+
+
+def sample_times_of_day(size: int, np_rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Mixture of morning/afternoon/evening peaks; returns hour, minute, second arrays
+    r = np_rng.random(size)
+    hour = np.where(
+        r < 0.45, np.clip(np_rng.normal(12, 2.5, size), 6, 17),
+        np.where(r < 0.8, np.clip(np_rng.normal(20, 2.5, size), 12, 23),
+                 np.clip(np_rng.normal(9, 1.5, size), 6, 12)),
+    ).astype(int)
+    minute = np_rng.integers(0, 60, size)
+    second = np_rng.integers(0, 60, size)
+    return hour, minute, second
 
 
 # --------------------------- Metrics ---------------------------
 
 def generate_post_metrics(
-    base_pop_scale: float,
-    event_intensity: float,
-    sentiment_label: str,
-    is_self: bool,
-    rng: random.Random
-) -> Tuple[int, float, int, int, int, int]:
-    # Popularity influenced by event intensity and post type
-    pop_multiplier = 1.0 + 0.8 * abs(event_intensity)
-    if not is_self:
-        pop_multiplier *= 1.1  # link posts can travel more on news subs
+    base_pop_scale: np.ndarray,
+    event_intensity: np.ndarray,
+    sentiment_labels: np.ndarray,
+    is_self: np.ndarray,
+    np_rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Vectorized over posts; returns ups, upvote_ratio, downs, score, num_comments, award_count arrays
+    n = len(base_pop_scale)
+    abs_ei = np.abs(event_intensity)
+
+    # Popularity influenced by event intensity and post type (link posts can travel more on news subs)
+    pop_multiplier = (1.0 + 0.8 * abs_ei) * np.where(is_self, 1.0, 1.1)
 
     # Ups via lognormal heavy tail, then clamp
-    ups = int(min(50000, rng.lognormvariate(mu=math.log(18 * base_pop_scale + 1e-9), sigma=1.1) * pop_multiplier))
+    ups = np.minimum(50000, np_rng.lognormal(np.log(18 * base_pop_scale + 1e-9), 1.1) * pop_multiplier).astype(np.int64)
 
     # Upvote ratio: neutral-high for positive, lower for negative
-    if sentiment_label == "positive":
-        ratio = float(clamp(rng.betavariate(20, 6), 0.55, 0.99))
-    elif sentiment_label == "negative":
-        ratio = float(clamp(rng.betavariate(10, 8), 0.50, 0.95))
-    else:
-        ratio = float(clamp(rng.betavariate(14, 8), 0.52, 0.97))
+    is_pos = sentiment_labels == "positive"
+    is_neg = sentiment_labels == "negative"
+    a = np.where(is_pos, 20.0, np.where(is_neg, 10.0, 14.0))
+    b = np.where(is_pos, 6.0, 8.0)
+    lo = np.where(is_pos, 0.55, np.where(is_neg, 0.50, 0.52))
+    hi = np.where(is_pos, 0.99, np.where(is_neg, 0.95, 0.97))
+    ratio = np.clip(np_rng.beta(a, b), lo, hi)
 
-    downs = int(max(0, round(ups * (1 - ratio) / max(1e-6, ratio))))
-    score = int(max(0, ups - downs))
+    downs = np.maximum(0, np.round(ups * (1 - ratio) / np.maximum(1e-6, ratio))).astype(np.int64)
+    score = np.maximum(0, ups - downs)
 
     # Comments scale sublinearly with ups
-    base_c = rng.uniform(0.4, 0.9) if is_self else rng.uniform(0.25, 0.7)
-    num_comments = int(max(0, rng.gauss(base_c * math.sqrt(ups + 1), 2.0) * (1.0 + 0.5 * abs(event_intensity))))
+    base_c = np_rng.uniform(np.where(is_self, 0.4, 0.25), np.where(is_self, 0.9, 0.7), n)
+    num_comments = np.maximum(0, np.trunc(np_rng.normal(base_c * np.sqrt(ups + 1), 2.0) * (1.0 + 0.5 * abs_ei))).astype(np.int64)
 
     # Awards: small Poisson depending on popularity
-    lam = 0.01 * math.sqrt(max(1, ups))  # <= handful typically
-    award_count = int(np.random.poisson(lam=lam))
+    lam = 0.01 * np.sqrt(np.maximum(1, ups))  # <= handful typically
+    award_count = np_rng.poisson(lam)
     return ups, ratio, downs, score, num_comments, award_count
 
 
+# Posts are assembled in fixed-size blocks, each with its own seed drawn in order, so the output
+# for a given seed does not depend on how many workers the blocks are spread over
+POST_BLOCK = 2000
+
+
+def build_posts_chunk(job: Dict[str, Any]) -> List[RedditPost]:
+    """
+    Assemble RedditPost records for the global post range [lo, hi).
+    The job carries the batched per-post draws and per-day drivers for that range, so it can
+    run in a worker process; string/choice draws use a job-local RNG seeded from job["seed"].
+    """
+    rng = random.Random(job["seed"])
+    np_rng = np.random.default_rng(job["seed"])
+    merchant_name = job["merchant_name"]
+    lo = job["lo"]
+    post_day = job["post_day"]
+    day_driver = job["day_driver"]
+    day_event_intensity = job["day_event_intensity"]
+    scores, labels, risks = job["scores"], job["labels"], job["risks"]
+    over_18, spoiler, locked, stickied = job["over_18"], job["spoiler"], job["locked"], job["stickied"]
+    removed, is_oc, crosspost, crosspost_counter = job["removed"], job["is_oc"], job["crosspost"], job["crosspost_counter"]
+    edited_roll = job["edited_roll"]
+    created_ts, edited_ts = job["created_ts"].tolist(), job["edited_ts"].tolist()
+    author_idx = job["author_idx"].tolist()
+    author_ids, author_fullnames, usernames = job["author_ids"], job["author_fullnames"], job["usernames"]
+
+    base_pop_scale = job["base_pop_scale"]
+    subreddit_idx = job["subreddit_idx"].tolist()
+
+    # Random id material for the whole chunk, drawn in batches
+    n_chunk = len(post_day)
+    post_hex = random_hex(np_rng, n_chunk, 3)
+    crosspost_hex = random_hex(np_rng, n_chunk, 3)
+    subreddit_bits = base36_array(np_rng.integers(0, 1 << 40, n_chunk))
+    post_counters = base36_array(np.arange(lo + 1, lo + n_chunk + 1))
+    crosspost_counters = base36_array(crosspost_counter)
+
+    # Per-post scalars as plain Python values, rounded once over the whole chunk
+    scores_out = np.round(scores, 4).tolist()
+    labels_out = labels.tolist()
+    risks_out = risks.tolist()
+    over_18_out, spoiler_out, locked_out, stickied_out = over_18.tolist(), spoiler.tolist(), locked.tolist(), stickied.tolist()
+    is_oc_out = is_oc.tolist()
+
+    rows: List[Dict[str, Any]] = []
+    self_flags: List[bool] = []
+    posts: List[RedditPost] = []
+    for j, di in enumerate(post_day.tolist()):
+        driver_event = day_driver[di]
+        s_label = labels_out[j]
+
+        # Subreddit (drawn in batch, weighted by event) and flair
+        subreddit = SUBREDDIT_NAMES[subreddit_idx[j]]
+        subreddit_id = make_subreddit_id(subreddit_bits[j])
+        flair_text = rng.choice(FLAIR_POOL.get(subreddit, ["Discussion"]))
+
+        # Title/selftext
+        title, selftext = build_title_and_text(merchant_name, s_label, driver_event, subreddit, rng)
+
+        # Determine post type and URL
+        is_self = selftext is not None
+        url = None
+        if not is_self:
+            url = rng.choice([
+                "https://news.example.com/article",
+                "https://blog.example.com/post",
+                "https://investor.example.com/report",
+                "https://security.example.com/incident",
+                "https://shop.example.com/product",
+                "https://media.example.com/press",
+            ])
+
+        # Moderation flags
+        removed_by_category = None
+        if removed[j]:
+            removed_by_category = rng.choice(["moderator", "copyright", "spam", "author"])
+
+        # Original content and crosspost
+        crosspost_parent = None
+        if crosspost[j]:
+            crosspost_parent = f"t3_{make_post_id(crosspost_counters[j], crosspost_hex[j])}"
+
+        # Edited
+        edited = False
+        if is_self and edited_roll[j]:
+            edited = edited_ts[j]
+
+        # ID and permalink
+        pid = make_post_id(post_counters[j], post_hex[j])
+        name = f"t3_{pid}"
+        slug = slugify(title)
+        permalink = f"/{subreddit}/comments/{pid}/{slug}/"
+
+        # Author selection (zipf-ranked, precomputed per post)
+        aidx = author_idx[j]
+        author_id = author_ids[aidx]
+        author_fullname = author_fullnames[aidx]
+        username = usernames[aidx]
+
+        # Keywords
+        keywords = extract_keywords(title, selftext, merchant_name)
+
+        rows.append(dict(
+            id=pid,
+            name=name,
+            author=f"u/{username}",
+            author_fullname=author_fullname,
+            author_id=author_id,
+            title=title,
+            selftext=selftext,
+            created_utc=created_ts[j],
+            created_at="",  # formatted in one pass after the monotonic fixup
+            subreddit=subreddit,
+            subreddit_id=subreddit_id,
+            permalink=permalink,
+            url=url,
+            is_self=is_self,
+            flair_text=flair_text,
+            over_18=over_18_out[j],
+            spoiler=spoiler_out[j],
+            locked=locked_out[j],
+            stickied=stickied_out[j],
+            keywords=keywords,
+            lang="en",
+            sentiment_score=scores_out[j],
+            sentiment_label=s_label,
+            risk_score=risks_out[j],
+            removed_by_category=removed_by_category,
+            is_original_content=is_oc_out[j],
+            crosspost_parent=crosspost_parent,
+            edited=edited
+        ))
+        self_flags.append(is_self)
+
+    # Metrics, batched over the chunk once post types are known
+    metrics = generate_post_metrics(
+        base_pop_scale, day_event_intensity[post_day], labels, np.array(self_flags, dtype=bool), np_rng
+    )
+    ups_a, ratio_a, downs_a, score_a, comments_a, awards_a = metrics
+    columns = (ups_a.tolist(), np.round(ratio_a, 3).tolist(), downs_a.tolist(), score_a.tolist(), comments_a.tolist(), awards_a.tolist())
+    for row, (ups, ratio, downs, score, num_comments, award_count) in zip(rows, zip(*columns)):
+        posts.append(RedditPost(
+            **row,
+            num_comments=num_comments,
+            upvote_ratio=ratio,
+            ups=ups,
+            downs=downs,
+            score=score,
+            award_count=award_count,
+        ))
+
+    return posts
+
+
 # --------------------------- Main generator ---------------------------
 
 def generate_fake_reddit_json(
@@ -532,7 +781,8 @@ def generate_fake_reddit_json(
     n_posts: int = 10000,
     trend_plan: Optional[List[Dict[str, Any]]] = None,
     seed: Optional[int] = None,
-    out_json_path: Optional[str] = None
+    out_json_path: Optional[str] = None,
+    max_workers: int = 1
 ) -> str:
     """
     Generate a fake Reddit submissions dataset related to a merchant.
@@ -542,10 +792,12 @@ def generate_fake_reddit_json(
     - trend_plan: list of events: {"month":"YYYY-MM","intensity":0..1,"label":str, optional "posts": share e.g., 0.1 or "10%"}
     - seed: RNG seed
     - out_json_path: optional output path; if None an auto name is used
+    - max_workers: >1 splits record assembly across that many worker processes; the output for a
+      given seed is the same whatever max_workers is
     Returns: path to the JSON file containing a list[RedditPost]
     """
     rng = random.Random(seed)
-    np.random.seed(seed if seed is not None else rng.randint(0, 2**32 - 1))
+    np_rng = np.random.default_rng(seed if seed is not None else rng.randint(0, 2**32 - 1))
 
     start = parse_date_str(start_date)
     end = parse_date_str(end_date)
@@ -559,14 +811,20 @@ def generate_fake_reddit_json(
         trend_plan = random_trend_plan(start, end, rng)
 
     # Daily intensity and events map
-    days, intensity, events_by_day = build_daily_intensity(start, end, trend_plan, rng)
+    days, intensity, (day_shift, day_event_intensity, day_driver) = build_daily_intensity(start, end, trend_plan, rng)
     weights = intensity / (intensity.sum() + 1e-12)
 
     # Apply monthly 'posts' shares if provided
     weights = apply_monthly_post_shares(days, weights, trend_plan)
 
-    # Allocate posts per day
-    posts_per_day = np.random.multinomial(final_n, weights)
+    # Allocate posts per day: independent Poisson counts, then trim/top up to exactly final_n
+    posts_per_day = np_rng.poisson(final_n * weights)
+    delta = final_n - int(posts_per_day.sum())
+    if delta > 0:
+        posts_per_day += np.bincount(np_rng.choice(len(days), delta, p=weights), minlength=len(days))
+    elif delta < 0:
+        slots = np.repeat(np.arange(len(days)), posts_per_day)
+        posts_per_day -= np.bincount(np_rng.choice(slots, -delta, replace=False), minlength=len(days))
 
     # Author pool (Zipf-like frequency)
     n_authors = max(300, min(1200, int(final_n / rng.uniform(2.5, 5.0))))
@@ -574,169 +832,97 @@ def generate_fake_reddit_json(
     author_ids = []
     author_fullnames = []
     usernames = []
-    for _ in range(n_authors):
-        aid, afn, uname = make_author_ids()
+    author_hex = random_hex(np_rng, n_authors, 10)
+    author_bits = base36_array(np_rng.integers(0, 1 << 40, n_authors))
+    for uhex, bits in zip(author_hex, author_bits):
+        aid, afn, uname = make_author_ids(uhex, bits)
         author_ids.append(aid)
         author_fullnames.append(afn)
         usernames.append(uname)
     # Zipf distribution for authors
     zipf_a = rng.uniform(1.3, 2.0)
-    zipf_raw = np.random.zipf(a=zipf_a, size=final_n)
+    zipf_raw = np_rng.zipf(a=zipf_a, size=int(posts_per_day.sum()))
     zipf_ranks = np.clip(zipf_raw, 1, n_authors) - 1
     # Shuffle authors for randomness
     indices = list(range(n_authors))
     rng.shuffle(indices)
-
-    # Time-of-day distribution: morning/afternoon/evening
-    def sample_time_of_day():
-        r = rng.random()
-        if r < 0.45:
-            hour = int(clamp(rng.gauss(12, 2.5), 6, 17))
-        elif r < 0.8:
-            hour = int(clamp(rng.gauss(20, 2.5), 12, 23))
-        else:
-            hour = int(clamp(rng.gauss(9, 1.5), 6, 12))
-        minute = rng.randint(0, 59)
-        second = rng.randint(0, 59)
-        return hour, minute, second
+    # Author index for every post, one gather instead of a lookup per post
+    author_idx = np.array(indices)[zipf_ranks]
 
     # Build posts
     posts: List[RedditPost] = []
-    counter = 1
     base_mu = rng.uniform(0.02, 0.12)  # neutral to slightly positive baseline
 
-    # For each day
-    for d, count in zip(days, posts_per_day):
-        if count == 0:
-            continue
-
-        day_events = events_by_day.get(d, [])
-        event_intensity_val = float(sum(abs(e["shift"]) * e["gaussian"] for e in day_events))
-
-        for _ in range(count):
-            # Sentiment
-            s_score, s_label, risk_score, driver_event = compute_sentiment_and_risk(base_mu, day_events, rng)
-
-            # Subreddit choice (weights by event)
-            subreddit, subreddit_id, flair_text = choose_subreddit(driver_event, rng)
-
-            # Title/selftext
-            title, selftext = build_title_and_text(merchant_name, s_label, driver_event, subreddit, rng)
-
-            # Determine post type and URL
-            is_self = selftext is not None
-            url = None
-            if not is_self:
-                url = rng.choice([
-                    "https://news.example.com/article",
-                    "https://blog.example.com/post",
-                    "https://investor.example.com/report",
-                    "https://security.example.com/incident",
-                    "https://shop.example.com/product",
-                    "https://media.example.com/press",
-                ])
-
-            # Metrics
-            base_pop_scale = rng.uniform(0.6, 1.6)
-            ups, ratio, downs, score, num_comments, award_count = generate_post_metrics(
-                base_pop_scale, event_intensity_val, s_label, is_self, rng
-            )
-
-            # Moderation flags
-            over_18 = rng.random() < 0.02  # small
-            spoiler = rng.random() < 0.03
-            locked = rng.random() < (0.02 + 0.05 * (1 if s_label == "negative" else 0))  # a bit higher for negative
-            stickied = rng.random() < 0.01
-            removed_by_category = None
-            if s_label == "negative" and rng.random() < clamp(0.02 + 0.03 * abs(s_score), 0, 0.12):
-                removed_by_category = rng.choice(["moderator", "copyright", "spam", "author"])
-
-            # Original content and crosspost
-            is_oc = rng.random() < 0.3
-            crosspost_parent = None
-            if rng.random() < 0.05:
-                crosspost_parent = f"t3_{make_post_id(rng.randint(1, 500000))}"
-
-            # Edited
-            edited = False
-            if is_self and rng.random() < 0.08:
-                # 50/50 chance store as timestamp
-                ts = datetime(d.year, d.month, d.day, *sample_time_of_day(), tzinfo=timezone.utc)
-                edited = int(ts.timestamp())
-
-            # Timestamp
-            hour, minute, second = sample_time_of_day()
-            created_dt = datetime(d.year, d.month, d.day, hour, minute, second, tzinfo=timezone.utc)
-            created_utc = int(created_dt.timestamp())
-            created_at = isoformat_dt(created_dt)
-
-            # ID and permalink
-            pid = make_post_id(counter)
-            name = f"t3_{pid}"
-            slug = slugify(title)
-            permalink = f"/{subreddit}/comments/{pid}/{slug}/"
-
-            # Author selection via zipf ranks
-            aidx = indices[zipf_ranks[len(posts) % len(zipf_ranks)]]
-            author_id = author_ids[aidx]
-            author_fullname = author_fullnames[aidx]
-            username = usernames[aidx]
-
-            # Keywords
-            keywords = extract_keywords(title, selftext, merchant_name)
-
-            post = RedditPost(
-                id=pid,
-                name=name,
-                author=f"u/{username}",
-                author_fullname=author_fullname,
-                author_id=author_id,
-                title=title,
-                selftext=selftext,
-                created_utc=created_utc,
-                created_at=created_at,
-                subreddit=subreddit,
-                subreddit_id=subreddit_id,
-                permalink=permalink,
-                url=url,
-                is_self=is_self,
-                flair_text=flair_text,
-                over_18=over_18,
-                spoiler=spoiler,
-                locked=locked,
-                stickied=stickied,
-                num_comments=num_comments,
-                upvote_ratio=round(ratio, 3),
-                ups=ups,
-                downs=downs,
-                score=score,
-                award_count=award_count,
-                keywords=keywords,
-                lang="en",
-                sentiment_score=round(float(s_score), 4),
-                sentiment_label=s_label,
-                risk_score=risk_score,
-                removed_by_category=removed_by_category,
-                is_original_content=is_oc,
-                crosspost_parent=crosspost_parent,
-                edited=edited
-            )
-            posts.append(post)
-            counter += 1
-
-    # Sort by created_at and ensure strictly increasing
-    posts.sort(key=lambda p: p.created_at)
-    last_dt = None
-    for p in posts:
-        cur_dt = datetime.fromisoformat(p.created_at.replace("Z", "+00:00"))
-        if last_dt is not None and cur_dt <= last_dt:
-            cur_dt = last_dt + timedelta(seconds=1)
-            p.created_at = isoformat_dt(cur_dt)
-            p.created_utc = int(cur_dt.timestamp())
-        last_dt = cur_dt
+    # Numeric per-post draws, batched over every post (posts are laid out day by day)
+    post_day = np.repeat(np.arange(len(days)), posts_per_day)
+    n_total = len(post_day)
+    scores, labels, risks = compute_sentiment_and_risk(np.clip(base_mu + day_shift[post_day], -0.95, 0.95), np_rng)
+    is_neg = labels == "negative"
+    over_18 = np_rng.random(n_total) < 0.02  # small
+    spoiler = np_rng.random(n_total) < 0.03
+    locked = np_rng.random(n_total) < np.where(is_neg, 0.07, 0.02)  # a bit higher for negative
+    stickied = np_rng.random(n_total) < 0.01
+    removed = is_neg & (np_rng.random(n_total) < np.clip(0.02 + 0.03 * np.abs(scores), 0, 0.12))
+    is_oc = np_rng.random(n_total) < 0.3
+    crosspost = np_rng.random(n_total) < 0.05
+    crosspost_counter = np_rng.integers(1, 500001, n_total)
+    edited_roll = np_rng.random(n_total) < 0.08
+    base_pop_scale = np_rng.uniform(0.6, 1.6, n_total)
+    day_bucket = np.array([subreddit_bucket(label) for label in day_driver], dtype=int)
+    subreddit_idx = choose_subreddits(day_bucket[post_day], np_rng)
+    # Epoch seconds as day start plus time of day; no per-post datetime construction
+    day_epoch = np.array(days, dtype="datetime64[D]").astype("datetime64[s]").astype(np.int64)[post_day]
+    hours, minutes, seconds = sample_times_of_day(n_total, np_rng)
+    created_ts = day_epoch + hours * 3600 + minutes * 60 + seconds
+    hours, minutes, seconds = sample_times_of_day(n_total, np_rng)
+    edited_ts = day_epoch + hours * 3600 + minutes * 60 + seconds
+
+    # Assemble records in POST_BLOCK-sized post ranges, optionally across worker processes
+    jobs = []
+    for lo in range(0, n_total, POST_BLOCK):
+        hi = min(lo + POST_BLOCK, n_total)
+        d_lo, d_hi = int(post_day[lo]), int(post_day[hi - 1]) + 1
+        jobs.append({
+            "merchant_name": merchant_name,
+            "seed": rng.getrandbits(63),
+            "lo": lo,
+            "post_day": post_day[lo:hi] - d_lo,
+            "day_driver": day_driver[d_lo:d_hi],
+            "day_event_intensity": day_event_intensity[d_lo:d_hi],
+            "scores": scores[lo:hi], "labels": labels[lo:hi], "risks": risks[lo:hi],
+            "over_18": over_18[lo:hi], "spoiler": spoiler[lo:hi], "locked": locked[lo:hi], "stickied": stickied[lo:hi],
+            "removed": removed[lo:hi], "is_oc": is_oc[lo:hi],
+            "crosspost": crosspost[lo:hi], "crosspost_counter": crosspost_counter[lo:hi],
+            "edited_roll": edited_roll[lo:hi],
+            "base_pop_scale": base_pop_scale[lo:hi],
+            "subreddit_idx": subreddit_idx[lo:hi],
+            "created_ts": created_ts[lo:hi], "edited_ts": edited_ts[lo:hi],
+            "author_idx": author_idx[lo:hi],
+            "author_ids": author_ids, "author_fullnames": author_fullnames, "usernames": usernames,
+        })
+    n_workers = max(1, min(int(max_workers or 1), len(jobs)))
+    if n_workers > 1:
+        # Each worker gets one contiguous run of blocks; pickling the run as a unit also sends the
+        # shared author lists once per worker rather than once per block
+        with ProcessPoolExecutor(max_workers=n_workers) as ex:
+            for chunk in ex.map(build_posts_chunk, jobs, chunksize=-(-len(jobs) // n_workers)):
+                posts.extend(chunk)
+    else:
+        for job in jobs:
+            posts.extend(build_posts_chunk(job))
+
+    # Sort by created_utc and ensure strictly increasing (ts[i] >= ts[i-1] + 1 as a running max),
+    # then format every ISO string in one vectorized pass
+    posts.sort(key=lambda p: p.created_utc)
+    steps = np.arange(len(posts), dtype=np.int64)
+    ts = np.maximum.accumulate(np.array([p.created_utc for p in posts], dtype=np.int64) - steps) + steps
+    iso = np.datetime_as_string(ts.astype("datetime64[s]"), unit="s")
+    for p, t, s in zip(posts, ts.tolist(), iso.tolist()):
+        p.created_utc = t
+        p.created_at = s + "Z"
 
     # Output list of dicts
-    out_list = [asdict(p) for p in posts]
+    out_list = [post_to_dict(p) for p in posts]
 
     # Default output path
     if out_json_path is None:
@@ -744,8 +930,12 @@ def generate_fake_reddit_json(
         safe_merchant = merchant_name.lower().replace(" ", "")
         out_json_path = f"reddit_{safe_merchant}_{start_date}_to_{end_date}_{ts}.json".replace(":", "-")
 
-    with open(out_json_path, "w", encoding="utf-8") as f:
-        json.dump(out_list, f, ensure_ascii=False, indent=2)
+    if HAVE_ORJSON:
+        with open(out_json_path, "wb") as f:
+            f.write(orjson.dumps(out_list, option=orjson.OPT_INDENT_2))
+    else:
+        with open(out_json_path, "w", encoding="utf-8") as f:
+            json.dump(out_list, f, ensure_ascii=False, indent=2)
 
     return out_json_path
 
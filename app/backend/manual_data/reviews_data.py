@@ -8,6 +8,12 @@ from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta, timezone, date
 import numpy as np
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
 
 @dataclass
 class ReviewRecord:
@@ -630,34 +636,33 @@ def generate_fake_reviews_json(
         safe = merchant_name.lower().replace(" ", "")
         out_json_path = f"reviews_{safe}_{start_date}_to_{end_date}_{ts}.json".replace(":", "-")
 
-    with open(out_json_path, "w", encoding="utf-8") as f:
-        json.dump(out_list, f, ensure_ascii=False, indent=2)
+    if HAVE_ORJSON:
+        with open(out_json_path, "wb") as f:
+            f.write(orjson.dumps(out_list, option=orjson.OPT_INDENT_2))
+    else:
+        with open(out_json_path, "w", encoding="utf-8") as f:
+            json.dump(out_list, f, ensure_ascii=False, indent=2)
 
     # Optional summary
     if save_summary:
-        # Compute realized averages overall and per product
+        # Compute realized averages overall and per product: one gather of (product, rating)
+        # per review, then count and sum per product with bincount
+        pid_index = {p["product_id"]: i for i, p in enumerate(products)}
+        codes = np.fromiter((pid_index[r.product_id] for r in reviews), dtype=np.intp, count=len(reviews))
+        ratings = np.fromiter((r.rating for r in reviews), dtype=np.float64, count=len(reviews))
+        counts = np.bincount(codes, minlength=len(products))
+        sums = np.bincount(codes, weights=ratings, minlength=len(products))
+        total_rating_sum = float(sums.sum())
         prod_stats: Dict[str, Dict[str, Any]] = {}
-        for p in products:
+        for i, p in enumerate(products):
+            cnt = int(counts[i])
             prod_stats[p["product_id"]] = {
                 "product_name": p["product_name"],
                 "sku": p["sku"],
                 "category": p["category"],
-                "count": 0,
-                "avg_rating": 0.0,
-                "helpful_votes": 0,
-                "views": 0
+                "count": cnt,
+                "avg_rating": round(float(sums[i]) / cnt, 3) if cnt > 0 else 0.0,
             }
-        total_rating_sum = 0.0
-        for r in reviews:
-            ps = prod_stats[r.product_id]
-            ps["count"] += 1
-            ps["avg_rating"] += r.rating
-            ps["helpful_votes"] += r.helpful_votes
-            ps["views"] += r.views
-            total_rating_sum += r.rating
-        for pid, ps in prod_stats.items():
-            if ps["count"] > 0:
-                ps["avg_rating"] = round(ps["avg_rating"] / ps["count"], 3)
 
         summary = {
             "merchant": merchant_name,
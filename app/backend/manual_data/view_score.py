@@ -3,8 +3,11 @@ import os
 import sys
 import math
 import argparse
+import importlib.util
 import datetime as dt
-from typing import Any, Dict, List, Optional, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -12,6 +15,19 @@ import plotly.express as px
 import plotly.graph_objects as go
 from pymongo import MongoClient, ASCENDING, DESCENDING
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+try:
+    import numba
+    HAVE_NUMBA = True
+except Exception:
+    HAVE_NUMBA = False
+
+try:
+    from scipy.signal import lfilter
+    HAVE_SCIPY = True
+except Exception:
+    HAVE_SCIPY = False
 
 # --------------------------- CLI args (for streamlit) ---------------------------
 
@@ -28,30 +44,57 @@ ARGS = get_cli_args()
 
 # --------------------------- Mongo helpers ---------------------------
 
+# Server cursor batch size for window scans (default is 101 docs, then getMore round trips)
+CURSOR_BATCH = 5000
+# Wire compression the server can negotiate; only offered when the codec module is installed
+WIRE_COMPRESSORS = ",".join(name for name, module in (("zstd", "zstandard"), ("snappy", "snappy")) if importlib.util.find_spec(module))
+
 @st.cache_resource
 def get_mongo(mongo_uri: str, db_name: str):
-    client = MongoClient(mongo_uri)
+    client = MongoClient(mongo_uri, **({"compressors": WIRE_COMPRESSORS} if WIRE_COMPRESSORS else {}))
     return client[db_name]
 
-@st.cache_data(ttl=30)
+# Index the evaluator also creates (risk_eval "eval_end"); backs the merchant + time-range scans
+EVAL_END_INDEX = [("merchant", ASCENDING), ("window_end_ts", ASCENDING)]
+# Partial index over backfill windows only, for the "backfill only" filter
+EVAL_BACKFILL_INDEX = [("merchant", ASCENDING), ("is_backfill", ASCENDING), ("window_end_ts", ASCENDING)]
+# Only the fields to_df reads
+EVAL_PROJECTION = {
+    "_id": 0, "merchant": 1, "window_start": 1, "window_end": 1, "window_start_ts": 1, "window_end_ts": 1,
+    "is_backfill": 1, "sim_now": 1, "created_at": 1, "algo_version": 1,
+    "scores": 1, "counts": 1, "confidence": 1, "drivers": 1,
+}
+
+@st.cache_resource
+def ensure_indexes(_db, collection: str) -> bool:
+    try:
+        _db[collection].create_index(EVAL_END_INDEX, name="eval_end")
+        _db[collection].create_index(
+            EVAL_BACKFILL_INDEX, name="eval_backfill_end", partialFilterExpression={"is_backfill": True}
+        )
+        return True
+    except Exception:
+        return False
+
+@st.cache_data(ttl=300)
 def list_merchants(_db, collection: str) -> List[str]:
+    # $group on the leading key of the (merchant, window_end_ts) index runs as a DISTINCT_SCAN
+    pipeline = [{"$group": {"_id": "$merchant"}}, {"$sort": {"_id": 1}}]
     try:
-        return sorted(_db[collection].distinct("merchant"))
+        kwargs = {"hint": EVAL_END_INDEX} if ensure_indexes(_db, collection) else {}
+        return [d["_id"] for d in _db[collection].aggregate(pipeline, **kwargs) if d.get("_id") is not None]
     except Exception:
         return []
 
-@st.cache_data(ttl=30)
-def load_docs(
-    _db,
-    collection: str,
+def window_query(
     merchant: str,
     since_ts: Optional[float],
     until_ts: Optional[float],
-    order: str = "asc",
-    limit: Optional[int] = None
-) -> List[Dict[str, Any]]:
-    coll = _db[collection]
-    q = {"merchant": merchant}
+    backfill_only: bool = False
+) -> Dict[str, Any]:
+    q: Dict[str, Any] = {"merchant": merchant}
+    if backfill_only:
+        q["is_backfill"] = True
     if since_ts is not None or until_ts is not None:
         ts_q = {}
         if since_ts is not None:
@@ -59,11 +102,70 @@ def load_docs(
         if until_ts is not None:
             ts_q["$lte"] = until_ts
         q["window_end_ts"] = ts_q
+    return q
+
+def window_cursor(
+    _db,
+    collection: str,
+    q: Dict[str, Any],
+    order: str = "asc",
+    limit: Optional[int] = None,
+    projection: Optional[Dict[str, int]] = None
+):
     sort_dir = ASCENDING if (order or "asc").lower() == "asc" else DESCENDING
-    cur = coll.find(q, projection={"_id": 0}).sort("window_end_ts", sort_dir)
+    cur = _db[collection].find(q, projection=projection or EVAL_PROJECTION).sort("window_end_ts", sort_dir)
+    if ensure_indexes(_db, collection):
+        cur = cur.hint(EVAL_BACKFILL_INDEX if q.get("is_backfill") is True else EVAL_END_INDEX)
     if limit and limit > 0:
         cur = cur.limit(int(limit))
-    return list(cur)
+    return cur.batch_size(min(int(limit), CURSOR_BATCH) if limit and limit > 0 else CURSOR_BATCH)
+
+@st.cache_data(ttl=30)
+def load_top_drivers(
+    _db,
+    collection: str,
+    merchant: str,
+    since_ts: Optional[float],
+    until_ts: Optional[float],
+    order: str = "asc",
+    limit: Optional[int] = None,
+    backfill_only: bool = False,
+    top_k: int = 25
+) -> Optional[pd.DataFrame]:
+    # Driver frequencies counted server-side; only top_k rows come back. None on failure.
+    pipeline: List[Dict[str, Any]] = [{"$match": window_query(merchant, since_ts, until_ts, backfill_only)}]
+    if limit and limit > 0:
+        # Same windows the chart loads: first `limit` in the selected order
+        sort_dir = ASCENDING if (order or "asc").lower() == "asc" else DESCENDING
+        pipeline += [{"$sort": {"window_end_ts": sort_dir}}, {"$limit": int(limit)}]
+    pipeline += [
+        {"$project": {"_id": 0, "drivers": 1}},
+        {"$unwind": "$drivers"},
+        {"$match": {"drivers": {"$nin": [None, ""]}}},
+        {"$sortByCount": "$drivers"},
+        {"$limit": int(top_k)},
+    ]
+    try:
+        rows = list(_db[collection].aggregate(pipeline, allowDiskUse=False))
+    except Exception:
+        return None
+    return pd.DataFrame([(r["_id"], r["count"]) for r in rows], columns=["driver", "count"])
+
+@st.cache_data(ttl=60)
+def load_range(_db, collection: str, merchant: str) -> Optional[Tuple[float, float]]:
+    # Earliest window start and latest window end in one $group round trip
+    pipeline = [
+        {"$match": {"merchant": merchant}},
+        {"$group": {"_id": None, "min_start": {"$min": "$window_start_ts"}, "max_end": {"$max": "$window_end_ts"}}},
+    ]
+    try:
+        kwargs = {"hint": EVAL_END_INDEX} if ensure_indexes(_db, collection) else {}
+        res = next(_db[collection].aggregate(pipeline, **kwargs), None)
+    except Exception:
+        return None
+    if not res or res.get("min_start") is None or res.get("max_end") is None:
+        return None
+    return float(res["min_start"]), float(res["max_end"])
 
 @st.cache_data(ttl=10)
 def load_progress(_db, progress_collection: str, merchant: str) -> Optional[Dict[str, Any]]:
@@ -74,62 +176,228 @@ def load_progress(_db, progress_collection: str, merchant: str) -> Optional[Dict
 
 # --------------------------- Data processing ---------------------------
 
-def to_df(docs: List[Dict[str, Any]]) -> pd.DataFrame:
-    if not docs:
-        return pd.DataFrame()
-    rows = []
+SCORE_COLS = ["total", "wl", "market", "sentiment", "volume", "incident_bump"]
+# (dataframe column, counts key)
+COUNT_COLS = [("tweets", "tweets"), ("reddit", "reddit"), ("news", "news"), ("reviews", "reviews"), ("wl_count", "wl"), ("stock_prices", "stock_prices")]
+BUZZ_COLS = ["tweets", "reddit", "news", "reviews"]
+META_COLS = ["merchant", "window_start", "window_end", "window_start_ts", "window_end_ts", "sim_now", "created_at", "algo_version"]
+RECENT_COLS = ["dt", "total", "wl", "market", "sentiment", "volume", "incident_bump", "confidence", "tweets", "reddit", "news", "reviews", "wl_count", "stock_prices", "is_backfill", "algo_version"]
+RECENT_PROJECTION = {
+    "_id": 0, "window_end": 1, "window_end_ts": 1, "is_backfill": 1, "algo_version": 1,
+    "scores": 1, "counts": 1, "confidence": 1,
+}
+
+def to_df(
+    docs: Iterable[Dict[str, Any]],
+    n: Optional[int] = None,
+    assume_sorted: bool = False,
+    reverse: bool = False
+) -> pd.DataFrame:
+    # Single pass into preallocated column arrays, then the dict-of-arrays DataFrame constructor.
+    # With n given, docs can be a live cursor and n only sizes the preallocation: docs inserted
+    # after the count grow the columns, a short read is trimmed.
+    # assume_sorted: docs already come ordered by window_end_ts (an index-ordered cursor), so the
+    # sort is skipped; reverse then flips a newest-first cursor back to ascending time.
+    if n is None:
+        docs = list(docs)
+        n = len(docs)
+        if not n:
+            return pd.DataFrame()
+    # A zero count still reads the cursor (windows may land after it); the columns grow from one slot
+    n = max(int(n), 1)
+    # Metadata stays in lists so pandas still infers their dtypes (epoch floats, datetimes, strings)
+    meta = {c: [None] * n for c in META_COLS}
+    is_backfill = [False] * n
+    scores_cols = {c: [0.0] * n for c in SCORE_COLS}
+    confidence = [0.0] * n
+    counts_cols = {c: [0] * n for c, _ in COUNT_COLS}
+    drivers = [None] * n
+    # Fixed schema, so the (field, column) pairs are bound once; the loop only does dict gets and
+    # list stores, and each column becomes a typed array in one np.array call at the end
+    # (element stores into ndarrays cost about twice as much per row)
+    meta_slots = list(meta.items())
+    score_slots = list(scores_cols.items())
+    count_slots = [(key, counts_cols[c]) for c, key in COUNT_COLS]
+    columns = [*meta.values(), is_backfill, *scores_cols.values(), confidence, *counts_cols.values(), drivers]
+    rows = 0
     for d in docs:
+        i = rows
+        if i == n:
+            # The cursor overran the count (windows written since): grow every column in place;
+            # the unused tail is trimmed below
+            for col in columns:
+                col.extend([None] * n)
+            n *= 2
+        for c, col in meta_slots:
+            col[i] = d.get(c)
+        is_backfill[i] = bool(d.get("is_backfill"))
         scores = d.get("scores") or {}
+        for c, col in score_slots:
+            col[i] = scores.get(c) or 0.0
+        confidence[i] = d.get("confidence") or 0.0
         counts = d.get("counts") or {}
-        rows.append({
-            "merchant": d.get("merchant"),
-            "window_start": d.get("window_start"),
-            "window_end": d.get("window_end"),
-            "window_start_ts": d.get("window_start_ts"),
-            "window_end_ts": d.get("window_end_ts"),
-            "is_backfill": bool(d.get("is_backfill")),
-            "sim_now": d.get("sim_now"),
-            "created_at": d.get("created_at"),
-            "algo_version": d.get("algo_version"),
-            "total": float(scores.get("total") or 0.0),
-            "wl": float(scores.get("wl") or 0.0),
-            "market": float(scores.get("market") or 0.0),
-            "sentiment": float(scores.get("sentiment") or 0.0),
-            "volume": float(scores.get("volume") or 0.0),
-            "incident_bump": float(scores.get("incident_bump") or 0.0),
-            "confidence": float(d.get("confidence") or 0.0),
-            "tweets": int(counts.get("tweets") or 0),
-            "reddit": int(counts.get("reddit") or 0),
-            "news": int(counts.get("news") or 0),
-            "reviews": int(counts.get("reviews") or 0),
-            "wl_count": int(counts.get("wl") or 0),
-            "stock_prices": int(counts.get("stock_prices") or 0),
-            "drivers": d.get("drivers") or []
-        })
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df["dt"] = pd.to_datetime(df["window_end"], utc=True, errors="coerce")
+        for key, col in count_slots:
+            col[i] = counts.get(key) or 0
+        drivers[i] = d.get("drivers") or []
+        rows += 1
+    if not rows:
+        return pd.DataFrame()
+    trim = (lambda v: v) if rows == n else (lambda v: v[:rows])
+    # Scores live in [0, 100] and confidence in [0, 1]: float32 halves what EMA and plotly scan.
+    # window_*_ts stay float64 epochs (float32 would round them to ~2 minutes).
+    counts_arr = {c: np.array(trim(v), dtype=np.int32) for c, v in counts_cols.items()}
+    df = pd.DataFrame({
+        **{c: trim(meta[c]) for c in META_COLS[:5]},
+        "is_backfill": np.array(trim(is_backfill), dtype=bool),
+        **{c: trim(meta[c]) for c in META_COLS[5:]},
+        **{c: np.array(trim(v), dtype=np.float32) for c, v in scores_cols.items()},
+        "confidence": np.array(trim(confidence), dtype=np.float32),
+        **counts_arr,
+        "drivers": trim(drivers),
+        # Total activity across the social/news streams, summed once here rather than per chart
+        "buzz": sum(counts_arr[c] for c in BUZZ_COLS),
+    })
+    # Window end from the epoch field (rounded to microseconds), no string parsing;
+    # only rows missing window_end_ts fall back to parsing the ISO string
+    end_ts = pd.to_numeric(df["window_end_ts"], errors="coerce").to_numpy(dtype=np.float64)
+    has_ts = np.isfinite(end_ts)
+    dts = pd.Series(pd.to_datetime(np.round(np.where(has_ts, end_ts, 0.0) * 1e6).astype(np.int64), unit="us", utc=True), index=df.index)
+    if not has_ts.all():
+        dts[~has_ts] = pd.to_datetime(df.loc[~has_ts, "window_end"], utc=True, errors="coerce")
+    df["dt"] = dts
+    if not assume_sorted:
         df = df.sort_values("dt")
+    elif reverse:
+        df = df.iloc[::-1]
     return df
 
-def ema(series: pd.Series, span: int) -> pd.Series:
-    try:
-        return series.ewm(span=max(1, int(span)), adjust=False).mean()
-    except Exception:
-        return series
+@st.cache_resource
+def get_ema_kernel():
+    # Built once per server process: the script reruns on every interaction and a
+    # module-level @njit would recompile each time (on-disk caching can't locate the script module)
+    @numba.njit(fastmath=True)
+    def ema_kernel(mat, alpha):
+        # Recursive EMA down each column (adjust=False form)
+        n_rows, n_cols = mat.shape
+        out = np.empty_like(mat)
+        for k in range(n_cols):
+            acc = mat[0, k]
+            out[0, k] = acc
+            for t in range(1, n_rows):
+                acc = alpha * mat[t, k] + (1.0 - alpha) * acc
+                out[t, k] = acc
+        return out
+    return ema_kernel
+
+def ema_batch(mat: np.ndarray, span: int) -> np.ndarray:
+    # EMA of every column of a (T, K) array in one call
+    span = max(1, int(span))
+    if len(mat) == 0:
+        return mat
+    alpha = 2.0 / (span + 1)
+    if HAVE_NUMBA:
+        return get_ema_kernel()(np.ascontiguousarray(mat), alpha)
+    if HAVE_SCIPY:
+        # Same recursion as a first-order IIR filter; zi seeds y[0] = x[0] like ewm(adjust=False)
+        out, _ = lfilter([alpha], [1.0, alpha - 1.0], mat, axis=0, zi=(1.0 - alpha) * mat[:1])
+        return out.astype(mat.dtype, copy=False)
+    return pd.DataFrame(mat).ewm(span=span, adjust=False).mean().to_numpy(dtype=mat.dtype)
+
+@st.cache_data(ttl=60)
+def ema_cached(mat_bytes: bytes, span: int, shape: Tuple[int, int]) -> np.ndarray:
+    # Memoized ema_batch over a float32 matrix; raw bytes give Streamlit a cheap, stable cache key
+    return ema_batch(np.frombuffer(mat_bytes, dtype=np.float32).reshape(shape), span)
+
+# Points kept per plotted line; about the horizontal pixel count of a wide chart
+LTTB_POINTS = 2000
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int = LTTB_POINTS) -> Dict[str, np.ndarray]:
+    # Largest-Triangle-Three-Buckets downsampling; returns Scatter x/y kwargs
+    n = len(y)
+    if n_out < 3 or n <= n_out:
+        return {"x": x, "y": y}
+    xf = x.astype("datetime64[ns]").astype(np.int64) if np.issubdtype(x.dtype, np.datetime64) else x
+    xf = xf.astype(np.float64)
+    yf = np.asarray(y, dtype=np.float64)
+    # n_out - 2 buckets between the fixed first and last points; the final "bucket" is the last point
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(np.append(edges, n))
+    avg_x = np.add.reduceat(xf, edges) / counts
+    avg_y = np.add.reduceat(yf, edges) / counts
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        xa, ya = xf[a], yf[a]
+        # Pick the point forming the largest triangle with the last pick and the next bucket's mean
+        area = np.abs((xa - avg_x[b + 1]) * (yf[lo:hi] - ya) - (xa - xf[lo:hi]) * (avg_y[b + 1] - ya))
+        a = lo + int(area.argmax())
+        idx[b + 1] = a
+    return {"x": x[idx], "y": y[idx]}
 
 def agg_top_drivers(df: pd.DataFrame, top_k: int = 20) -> pd.DataFrame:
     if df.empty or "drivers" not in df.columns:
         return pd.DataFrame(columns=["driver", "count"])
-    drivers = []
-    for lst in df["drivers"]:
+    counts = Counter()
+    for lst in df["drivers"].values:
         if isinstance(lst, list):
-            drivers.extend([x for x in lst if x])
-    if not drivers:
+            counts.update(x for x in lst if x)
+    if not counts:
         return pd.DataFrame(columns=["driver", "count"])
-    s = pd.Series(drivers).value_counts().reset_index()
-    s.columns = ["driver", "count"]
-    return s.head(top_k)
+    return pd.DataFrame(counts.most_common(top_k), columns=["driver", "count"])
+
+# --------------------------- Cached derived data ---------------------------
+
+@st.cache_data(ttl=30)
+def load_df(
+    _db,
+    collection: str,
+    merchant: str,
+    since_ts: Optional[float],
+    until_ts: Optional[float],
+    order: str = "asc",
+    limit: Optional[int] = None,
+    backfill_only: bool = False
+) -> pd.DataFrame:
+    # Keyed by the query, so widget-only reruns skip to_df entirely. The cursor is decoded
+    # straight into column arrays sized by a count, without a list of docs in between.
+    q = window_query(merchant, since_ts, until_ts, backfill_only)
+    count_kwargs = {"limit": int(limit)} if limit and limit > 0 else {}
+    n = _db[collection].count_documents(q, **count_kwargs)
+    return to_df(window_cursor(_db, collection, q, order, limit), n, assume_sorted=True, reverse=(order or "asc").lower() != "asc")
+
+@st.cache_data(ttl=30)
+def cached_top_drivers(
+    _db,
+    collection: str,
+    merchant: str,
+    since_ts: Optional[float],
+    until_ts: Optional[float],
+    order: str = "asc",
+    limit: Optional[int] = None,
+    backfill_only: bool = False,
+    top_k: int = 25
+) -> pd.DataFrame:
+    df = load_df(_db, collection, merchant, since_ts, until_ts, order=order, limit=limit, backfill_only=backfill_only)
+    return agg_top_drivers(df, top_k=top_k)
+
+@st.cache_data(ttl=30)
+def load_recent(
+    _db,
+    collection: str,
+    merchant: str,
+    since_ts: Optional[float],
+    until_ts: Optional[float],
+    limit: int = 200,
+    backfill_only: bool = False
+) -> pd.DataFrame:
+    # Newest `limit` windows straight off the index (sort -1 + limit), display fields only.
+    # The table shows newest first, so the desc cursor is kept as is (no reverse).
+    q = window_query(merchant, since_ts, until_ts, backfill_only)
+    cur = window_cursor(_db, collection, q, "desc", limit, RECENT_PROJECTION)
+    df = to_df(cur, assume_sorted=True)
+    return df[RECENT_COLS] if not df.empty else df
 
 # --------------------------- Streamlit UI ---------------------------
 
@@ -147,13 +415,11 @@ with st.sidebar:
     st.subheader("Controls")
     merchant = st.selectbox("Merchant", merchants, index=0)
 
-    # Discover range from DB quickly (sample head/tail)
-    # Load earliest and latest by sorting if possible (limit small)
-    earliest_docs = load_docs(db, ARGS.collection, merchant, None, None, order="asc", limit=1)
-    latest_docs = load_docs(db, ARGS.collection, merchant, None, None, order="desc", limit=1)
-    if earliest_docs and latest_docs:
-        min_dt = pd.to_datetime(earliest_docs[0].get("window_start"), utc=True)
-        max_dt = pd.to_datetime(latest_docs[0].get("window_end"), utc=True)
+    # Discover range from DB with a single min/max aggregation
+    ts_range = load_range(db, ARGS.collection, merchant)
+    if ts_range:
+        min_dt = pd.to_datetime(ts_range[0], unit="s", utc=True)
+        max_dt = pd.to_datetime(ts_range[1], unit="s", utc=True)
     else:
         min_dt = pd.Timestamp(dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc))
         max_dt = pd.Timestamp(dt.datetime.now(dt.timezone.utc))
@@ -172,6 +438,9 @@ with st.sidebar:
     show_components = st.checkbox("Show components", value=True)
     show_confidence = st.checkbox("Show confidence", value=True)
     show_incident_bump = st.checkbox("Show incident bump", value=True)
+    show_buzz = st.checkbox("Show activity counts", value=True)
+    show_drivers = st.checkbox("Show top drivers", value=True)
+    show_recent = st.checkbox("Show recent windows", value=True)
     show_backfill_only = st.checkbox("Filter: backfill only", value=False)
     auto_refresh = st.checkbox("Auto-refresh (30s)", value=False)
 
@@ -186,10 +455,17 @@ if auto_refresh:
 # Load docs in selected range
 since_ts = since_dt.timestamp() if since_dt else None
 until_ts = until_dt.timestamp() if until_dt else None
-docs = load_docs(db, ARGS.collection, merchant, since_ts, until_ts, order=order, limit=limit)
-df = to_df(docs)
-if show_backfill_only and not df.empty:
-    df = df[df["is_backfill"] == True]
+# When the chart holds the oldest `limit` windows, the recent table comes from df itself
+recent_from_df = bool(limit) and order == "asc"
+# The reads below are independent, so they go out together (PyMongo releases the GIL on socket
+# reads) and first paint waits on the slowest round trip rather than the sum of all four.
+# load_range can't join them: the date range widget that feeds since/until depends on it.
+with ThreadPoolExecutor(max_workers=4, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())) as pool:
+    df_future = pool.submit(load_df, db, ARGS.collection, merchant, since_ts, until_ts, order=order, limit=limit, backfill_only=show_backfill_only)
+    drv_future = pool.submit(load_top_drivers, db, ARGS.collection, merchant, since_ts, until_ts, order=order, limit=limit, backfill_only=show_backfill_only, top_k=25) if show_drivers else None
+    recent_future = None if recent_from_df or not show_recent else pool.submit(load_recent, db, ARGS.collection, merchant, since_ts, until_ts, limit=min(limit, 200) if limit else 200, backfill_only=show_backfill_only)
+    prog_future = pool.submit(load_progress, db, ARGS.progress_collection, merchant)
+df = df_future.result()
 
 if df.empty:
     st.info("No evaluation documents found for the selected filters.")
@@ -210,15 +486,28 @@ with colE:
 
 st.markdown("---")
 
+# Smooth every charted series in one batched EMA pass
+counts_cols = BUZZ_COLS
+raw = df[["total", "wl", "market", "sentiment", "volume", "buzz"] + counts_cols].assign(confidence=df["confidence"] * 100.0)
+raw_mat = np.ascontiguousarray(raw.to_numpy(dtype=np.float32))
+smoothed = dict(zip(raw.columns, ema_cached(raw_mat.tobytes(), smooth_span, raw_mat.shape).T))
+# Downsample each line before it goes to the browser; traces get plain NumPy arrays, not Series
+x_np = df["dt"].to_numpy(dtype="datetime64[ns]")
+lines = {k: lttb(x_np, v) for k, v in smoothed.items()}
+
+# Zoom/legend state survives widget-only reruns but resets when the merchant or range changes
+ui_rev = f"{merchant}|{since_ts}|{until_ts}"
+
 # Main chart: total risk over time
 fig_total = go.Figure()
-fig_total.add_trace(go.Scatter(x=df["dt"], y=ema(df["total"], smooth_span), name="Total risk", mode="lines", line=dict(color="#1f77b4", width=2)))
+fig_total.add_trace(go.Scatter(**lines["total"], name="Total risk", mode="lines", line=dict(color="#1f77b4", width=2)))
 # Risk threshold bands
 for thr, color in [(25, "#e0e0e0"), (50, "#cccccc"), (75, "#bbbbbb")]:
     fig_total.add_hline(y=thr, line=dict(color=color, width=1, dash="dot"), annotation_text=f"{thr}", annotation_position="top left")
 if show_confidence:
-    fig_total.add_trace(go.Scatter(x=df["dt"], y=ema(df["confidence"] * 100.0, smooth_span), name="Confidence (%)", mode="lines", yaxis="y2", line=dict(color="#ff7f0e", width=1)))
+    fig_total.add_trace(go.Scatter(**lines["confidence"], name="Confidence (%)", mode="lines", yaxis="y2", line=dict(color="#ff7f0e", width=1)))
 fig_total.update_layout(
+    uirevision=ui_rev,
     title="Total risk score over time",
     xaxis_title="Window end",
     yaxis=dict(title="Risk (0..100)"),
@@ -228,52 +517,62 @@ fig_total.update_layout(
 )
 st.plotly_chart(fig_total, use_container_width=True)
 
-# Components chart
+# Secondary sections sit in expanders; each sidebar switch skips building its figure/table
+# (and its query) outright, since an expander body still runs while collapsed
 if show_components:
-    fig_comp = go.Figure()
-    fig_comp.add_trace(go.Scatter(x=df["dt"], y=ema(df["wl"], smooth_span), name="WL", mode="lines"))
-    fig_comp.add_trace(go.Scatter(x=df["dt"], y=ema(df["market"], smooth_span), name="Market", mode="lines"))
-    fig_comp.add_trace(go.Scatter(x=df["dt"], y=ema(df["sentiment"], smooth_span), name="Sentiment", mode="lines"))
-    fig_comp.add_trace(go.Scatter(x=df["dt"], y=ema(df["volume"], smooth_span), name="Volume/Anomaly", mode="lines"))
-    if show_incident_bump:
-        fig_comp.add_trace(go.Bar(x=df["dt"], y=df["incident_bump"], name="Incident bump", marker_color="#d62728", opacity=0.35))
-    fig_comp.update_layout(
-        title="Risk components",
-        xaxis_title="Window end",
-        yaxis=dict(title="Score component (0..100)"),
-        template="plotly_white",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1.0)
-    )
-    st.plotly_chart(fig_comp, use_container_width=True)
+    with st.expander("Risk components", expanded=True):
+        fig_comp = go.Figure()
+        fig_comp.add_trace(go.Scatter(**lines["wl"], name="WL", mode="lines"))
+        fig_comp.add_trace(go.Scatter(**lines["market"], name="Market", mode="lines"))
+        fig_comp.add_trace(go.Scatter(**lines["sentiment"], name="Sentiment", mode="lines"))
+        fig_comp.add_trace(go.Scatter(**lines["volume"], name="Volume/Anomaly", mode="lines"))
+        if show_incident_bump:
+            fig_comp.add_trace(go.Bar(x=x_np, y=df["incident_bump"].to_numpy(dtype=np.float32), name="Incident bump", marker_color="#d62728", opacity=0.35))
+        fig_comp.update_layout(
+            uirevision=ui_rev,
+            title="Risk components",
+            xaxis_title="Window end",
+            yaxis=dict(title="Score component (0..100)"),
+            template="plotly_white",
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1.0)
+        )
+        st.plotly_chart(fig_comp, use_container_width=True)
 
 # Activity counts (buzz)
-counts_cols = ["tweets", "reddit", "news", "reviews"]
-buzz_df = df[["dt"] + counts_cols].copy()
-buzz_df["buzz"] = buzz_df[counts_cols].sum(axis=1)
-fig_buzz = go.Figure()
-fig_buzz.add_trace(go.Scatter(x=buzz_df["dt"], y=ema(buzz_df["buzz"].astype(float), smooth_span), name="Buzz (total activity)", mode="lines", line=dict(color="#2ca02c")))
-for col, color in zip(counts_cols, ["#1f77b4", "#ff7f0e", "#9467bd", "#8c564b"]):
-    fig_buzz.add_trace(go.Scatter(x=buzz_df["dt"], y=ema(buzz_df[col].astype(float), smooth_span), name=col.title(), mode="lines", line=dict(color=color, width=1)))
-fig_buzz.update_layout(template="plotly_white", title="Activity counts per window", xaxis_title="Window end", yaxis_title="Count")
-st.plotly_chart(fig_buzz, use_container_width=True)
+if show_buzz:
+    with st.expander("Activity counts", expanded=False):
+        fig_buzz = go.Figure()
+        fig_buzz.add_trace(go.Scatter(**lines["buzz"], name="Buzz (total activity)", mode="lines", line=dict(color="#2ca02c")))
+        for col, color in zip(counts_cols, ["#1f77b4", "#ff7f0e", "#9467bd", "#8c564b"]):
+            fig_buzz.add_trace(go.Scatter(**lines[col], name=col.title(), mode="lines", line=dict(color=color, width=1)))
+        fig_buzz.update_layout(uirevision=ui_rev, template="plotly_white", title="Activity counts per window", xaxis_title="Window end", yaxis_title="Count")
+        st.plotly_chart(fig_buzz, use_container_width=True)
 
 # Top drivers
-st.subheader("Top drivers")
-drv_df = agg_top_drivers(df, top_k=25)
-if drv_df.empty:
-    st.info("No drivers found.")
-else:
-    st.plotly_chart(px.bar(drv_df, x="driver", y="count", title="Drivers (frequency)").update_layout(template="plotly_white"), use_container_width=True)
+if show_drivers:
+    with st.expander("Top drivers", expanded=False):
+        drv_df = drv_future.result()
+        if drv_df is None:
+            drv_df = cached_top_drivers(db, ARGS.collection, merchant, since_ts, until_ts, order=order, limit=limit, backfill_only=show_backfill_only, top_k=25)
+        if drv_df.empty:
+            st.info("No drivers found.")
+        else:
+            st.plotly_chart(px.bar(drv_df, x="driver", y="count", title="Drivers (frequency)").update_layout(template="plotly_white"), use_container_width=True)
 
 # Recent windows table
-st.subheader("Recent windows")
-show_cols = ["dt", "total", "wl", "market", "sentiment", "volume", "incident_bump", "confidence", "tweets", "reddit", "news", "reviews", "wl_count", "stock_prices", "is_backfill", "algo_version"]
-st.dataframe(df.sort_values("dt", ascending=False).head(200)[show_cols], use_container_width=True)
+if show_recent:
+    with st.expander("Recent windows", expanded=False):
+        if recent_from_df:
+            # Newest of the loaded windows (df is ascending)
+            recent_df = df.iloc[::-1].head(200)[RECENT_COLS]
+        else:
+            recent_df = recent_future.result()
+        st.dataframe(recent_df, use_container_width=True)
 
 # Progress (if available)
 st.markdown("---")
 st.subheader("Backfill progress")
-prog = load_progress(db, ARGS.progress_collection, merchant)
+prog = prog_future.result()
 if prog:
     cols = st.columns(4)
     with cols[0]:
@@ -8,6 +8,12 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta, timezone, date
 import numpy as np
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
 
 # --------------------------- Data classes ---------------------------
 
@@ -738,8 +744,12 @@ def generate_fake_wl_json(
         safe_merchant = merchant_name.lower().replace(" ", "")
         out_json_path = f"wl_{safe_merchant}_{start_date}_to_{end_date}_{ts}.json".replace(":", "-")
 
-    with open(out_json_path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    if HAVE_ORJSON:
+        with open(out_json_path, "wb") as f:
+            f.write(orjson.dumps(out, option=orjson.OPT_INDENT_2))
+    else:
+        with open(out_json_path, "w", encoding="utf-8") as f:
+            json.dump(out, f, ensure_ascii=False, indent=2)
 
     return out_json_path
 
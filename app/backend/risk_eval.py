@@ -7,7 +7,9 @@ only keeps the latest windows fresh. See `RiskEvaluator` for orchestration.
 """
 
 from __future__ import annotations
-import os, json, time, datetime as dt, statistics, random, threading, bisect
+import os, json, time, math, datetime as dt, random, threading, bisect, hashlib
+from collections import OrderedDict
+from itertools import repeat
 from typing import Any, Dict, List, Optional, Tuple
 from pymongo import ASCENDING, ReturnDocument
 
@@ -94,6 +96,8 @@ ALT_SENTIMENT_FIELDS = ["sentiment", "score", "polarity", "senti", "sent"]
 ALT_REVIEW_FIELDS = ["rating", "stars", "score", "review_rating"]
 ALT_STATUS_FIELDS = ["status", "state", "flag", "flag_status"]
 ALT_PRICE_FIELDS = ["price", "close", "adj_close", "close_price", "last"]
+TOKEN_STRIP = ".,!?;:\"()[]{}"
+TEXT_SENTIMENT_CACHE_MAX = 50000
 
 # Stream collection canonical names (used for range discovery & diagnostics)
 STREAM_COLLECTIONS = [
@@ -157,6 +161,7 @@ class RiskEvaluator:
         self._dispatch_initialized = False
         self._ts_scale_cache: Dict[tuple, str] = {}
         self._ts_field_cache: Dict[tuple, Dict[str, Any]] = {}  # (coll, merchant) -> {field, scale, detected_at}
+        self._text_sentiment_cache: "OrderedDict[bytes, Optional[float]]" = OrderedDict()  # text digest -> heuristic score, LRU (overlapping windows re-read the same docs)
         self._positive_words = {
             "good",
             "great",
@@ -203,6 +208,11 @@ class RiskEvaluator:
             "angry",
             "disappointed",
         }
+        # Single token -> polarity (+1/-1) table so each token costs one dict lookup
+        self._word_polarity: Dict[str, int] = {
+            **{w: -1 for w in self._negative_words},
+            **{w: 1 for w in self._positive_words},
+        }
         self.jobs: Dict[str, Dict[str, Any]] = {}
         # Prefetch cache (per merchant + interval) built per backfill batch
         # Structure: {(merchant, interval_minutes): { 'range': (start_ts, end_ts), 'streams': {stream: [docs_sorted_by_ts]}, 'ts_field': 'ts' }}
@@ -583,6 +593,14 @@ class RiskEvaluator:
             return None
         return num / den
 
+    @staticmethod
+    def _pstdev(vals: List[float]) -> float:
+        # Population std in floats (fsum keeps it accurate); statistics.pstdev does the same
+        # sums in exact Fractions, which is several times slower on windows of ~1k returns
+        n = len(vals)
+        mean = math.fsum(vals) / n
+        return math.sqrt(math.fsum((v - mean) * (v - mean) for v in vals) / n)
+
     # ---------------- Primitive data extraction -----------------
     def _avg_sentiment(
         self, coll_name: str, merchant: str, start_ts: float, end_ts: float
@@ -696,7 +714,7 @@ class RiskEvaluator:
         if len(rets) < 2:
             return None
         try:
-            return statistics.pstdev(rets)
+            return self._pstdev(rets)
         except Exception:
             return None
 
@@ -984,7 +1002,7 @@ class RiskEvaluator:
         if len(rets) < 2:
             return None
         try:
-            return statistics.pstdev(rets)
+            return self._pstdev(rets)
         except Exception:
             return None
 
@@ -2159,24 +2177,29 @@ class RiskEvaluator:
     def _infer_sentiment_from_text(self, text: str) -> Optional[float]:
         if not text:
             return None
+        cache = self._text_sentiment_cache
+        # Keyed on a digest so the cache never pins the document bodies themselves
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
         try:
-            txt = text.lower()
-            pos_hits = 0
-            neg_hits = 0
-            for tok in txt.replace("\n", " ").split():
-                t = tok.strip(".,!?;:\"()[]{}").lower()
-                if not t:
-                    continue
-                if t in self._positive_words:
-                    pos_hits += 1
-                elif t in self._negative_words:
-                    neg_hits += 1
-            total = pos_hits + neg_hits
-            if total == 0:
-                return None
-            return max(-1.0, min(1.0, (pos_hits - neg_hits) / total))
+            score = cache[key]
+            cache.move_to_end(key)
+            return score
+        except KeyError:
+            pass
+        try:
+            # (pos - neg) / (pos + neg) == mean polarity over the lexicon hits
+            polarity = self._word_polarity
+            hits = [polarity[t] for t in map(str.strip, text.lower().split(), repeat(TOKEN_STRIP)) if t in polarity]
+            score = max(-1.0, min(1.0, sum(hits) / len(hits))) if hits else None
         except Exception:
             return None
+        cache[key] = score
+        while len(cache) > TEXT_SENTIMENT_CACHE_MAX:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                break
+        return score
 
     def get_metrics(self) -> Dict[str, Any]:
         out = dict(self.metrics)
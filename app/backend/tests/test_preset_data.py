@@ -0,0 +1,57 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "manual_data"))
+import preset_data  # noqa: E402
+
+
+def run_main(monkeypatch, tmp_path, *argv):
+    out = tmp_path / "preset.json"
+    monkeypatch.setattr(sys, "argv", ["preset_data.py", *argv, "--out", str(out)])
+    preset_data.main()
+    return json.loads(out.read_text(encoding="utf-8"))
+
+
+def merchant_names(preset):
+    return [m["merchant_name"] for m in preset["merchants"]]
+
+
+def test_num_zero_keeps_quick_custom_merchant(monkeypatch, tmp_path):
+    preset = run_main(monkeypatch, tmp_path, "--num", "0", "--merchant_name", "Acme")
+    assert merchant_names(preset) == ["Acme"]
+    assert preset["merchants"][0]["start_date"] == "2020-01-01"
+
+
+def test_unmatched_custom_merges_into_first_merchant(monkeypatch, tmp_path):
+    preset = run_main(monkeypatch, tmp_path, "--num", "2", "--merchant_name", "Acme")
+    assert merchant_names(preset) == ["Acme", "BuildPro"]
+
+
+def test_matching_custom_merges_into_random_merchant(monkeypatch, tmp_path):
+    preset = run_main(monkeypatch, tmp_path, "--num", "2", "--merchant_name", "buildpro")
+    assert merchant_names(preset) == ["HomeGear", "buildpro"]
+
+
+def test_unnamed_custom_merges_into_first_merchant(monkeypatch, tmp_path):
+    custom = tmp_path / "custom.json"
+    custom.write_text(json.dumps({"tweets": {"n_tweets": 5}}), encoding="utf-8")
+    preset = run_main(monkeypatch, tmp_path, "--num", "1", "--custom", str(custom))
+    assert merchant_names(preset) == ["HomeGear"]
+    assert preset["merchants"][0]["tweets"]["n_tweets"] == 5
+
+
+def test_unnamed_custom_with_num_zero_gets_next_name(monkeypatch, tmp_path):
+    custom = tmp_path / "custom.json"
+    custom.write_text(json.dumps({"tweets": {"n_tweets": 5}}), encoding="utf-8")
+    preset = run_main(monkeypatch, tmp_path, "--num", "0", "--custom", str(custom))
+    assert merchant_names(preset) == ["HomeGear"]
+    assert preset["merchants"][0]["tweets"]["n_tweets"] == 5
+
+
+@pytest.mark.parametrize("num", [0, 3])
+def test_output_is_valid_without_customs(monkeypatch, tmp_path, num):
+    preset = run_main(monkeypatch, tmp_path, "--num", str(num))
+    assert len(preset["merchants"]) == num
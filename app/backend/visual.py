@@ -30,6 +30,10 @@ DEFAULT_API_BASE = os.getenv("DATA_API_BASE", "http://127.0.0.1:8000")
 REQUEST_TIMEOUT = float(os.getenv("DATA_API_TIMEOUT", "10.0"))
 LOG_REQUESTS = str(os.getenv("DASH_LOG_REQUESTS", "true")).lower() in ("1","true","yes","on")
 
+# Above this many articles the news scatter is drawn from a binned grid instead of raw points
+NEWS_SCATTER_MAX_POINTS = int(os.getenv("DASH_NEWS_SCATTER_MAX_POINTS", "5000"))
+NEWS_SCATTER_BINS = 60
+
 DEFAULT_STREAMS = ["tweets","reddit","news","reviews","stock","wl"]
 STREAM_TO_DF_KEY = {
     "tweets": "tweets",
@@ -61,6 +65,7 @@ def init_state():
     set_default("allow_future", False)
 
     set_default("include_stock_meta", True)
+    set_default("show_tables", False)
     set_default("stock_window_days", 90)
 
     set_default("merchant_select", "HomeGear")
@@ -125,6 +130,12 @@ def ensure_sentiment_columns(df: pd.DataFrame) -> pd.DataFrame:
         d["sentiment_label"] = None
     if "sentiment_score" not in d.columns:
         d["sentiment_score"] = None
+    # Scores live in [-1, 1] and are only averaged/charted, so float32 halves the column
+    d["sentiment_score"] = pd.to_numeric(d["sentiment_score"], errors="coerce").astype(np.float32)
+    # Low-cardinality labels: int8 codes instead of a Python str pointer per row
+    for c in ("sentiment_label", "lang", "language"):
+        if c in d.columns and d[c].dtype == object:
+            d[c] = d[c].astype("category")
     return d
 
 def parse_dt_column(df: pd.DataFrame, stream: str) -> pd.DataFrame:
@@ -161,16 +172,43 @@ def parse_dt_column(df: pd.DataFrame, stream: str) -> pd.DataFrame:
 
 # --------------------------- Plot helpers ---------------------------
 
+# Single-trace charts are built with go directly: px.bar/px.histogram run their wide-form and
+# grouping machinery on every call (~40ms each) even when there is nothing to group by color
+def bar_figure(x, y, title: str, x_title: str, y_title: str = "count") -> go.Figure:
+    fig = go.Figure(go.Bar(x=np.asarray(x), y=np.asarray(y)))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    return fig
+
+def histogram_figure(values, nbins: int, title: str, x_title: str) -> go.Figure:
+    fig = go.Figure(go.Histogram(x=np.asarray(values), nbinsx=nbins))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title="count")
+    return fig
+
 def plot_sentiment_counts(df: pd.DataFrame, title: str) -> Optional[go.Figure]:
     if df is None or df.empty:
         return None
     if "sentiment_label" not in df.columns:
         return None
-    vc = df["sentiment_label"].fillna("neutral").astype(str).value_counts()
-    fig = px.bar(vc, title=title)
+    lab = df["sentiment_label"]
+    if isinstance(lab.dtype, pd.CategoricalDtype):
+        if "neutral" not in lab.cat.categories:
+            lab = lab.cat.add_categories(["neutral"])
+        vc = lab.fillna("neutral").value_counts()
+        vc = vc[vc > 0]
+        vc.index = vc.index.astype(str)
+    else:
+        vc = lab.fillna("neutral").astype(str).value_counts()
+    fig = bar_figure(vc.index, vc.values, title, x_title="sentiment_label")
     fig.update_layout(template="plotly_white")
     return fig
 
+@st.cache_data(ttl=300, show_spinner=False)
+def count_hashtags(texts: pd.Series) -> pd.Series:
+    # One vectorized findall + explode over the column. The regex scan costs far more than
+    # st.cache_data hashing the column, so reruns with unchanged tweets reuse the counts
+    tags = texts.dropna().astype(str).str.findall(r"#([0-9A-Za-z_]+)").explode().dropna()
+    return tags.value_counts()
+
 def plot_top_hashtags(df: pd.DataFrame) -> Optional[go.Figure]:
     if df is None or df.empty:
         return None
@@ -180,14 +218,12 @@ def plot_top_hashtags(df: pd.DataFrame) -> Optional[go.Figure]:
             text_col = c; break
     if not text_col:
         return None
-    tags = []
-    for s in df[text_col].dropna():
-        s = str(s)
-        tags.extend([x[1:] for x in pd.Series(s).str.findall(r"#([0-9A-Za-z_]+)").explode().dropna()])
-    if not len(tags):
+    counts = count_hashtags(df[text_col])
+    if not len(counts):
         return None
-    s = pd.Series(tags).value_counts().reset_index().rename(columns={"index":"hashtag",0:"count"})
-    fig = px.bar(s.head(20), x="hashtag", y="count", title="Top hashtags")
+    s = counts.rename_axis("hashtag").reset_index()
+    top = s.head(20)
+    fig = bar_figure(top["hashtag"], top["count"], "Top hashtags", x_title="hashtag")
     fig.update_layout(template="plotly_white")
     return fig
 
@@ -195,7 +231,7 @@ def plot_top_subreddits(df: pd.DataFrame) -> Optional[go.Figure]:
     if df is None or df.empty or "subreddit" not in df.columns:
         return None
     vc = df["subreddit"].astype(str).value_counts().head(20)
-    fig = px.bar(vc, title="Top subreddits")
+    fig = bar_figure(vc.index, vc.values, "Top subreddits", x_title="subreddit")
     fig.update_layout(template="plotly_white")
     return fig
 
@@ -203,50 +239,99 @@ def plot_news_scatter(df: pd.DataFrame) -> Optional[go.Figure]:
     if df is None or df.empty:
         return None
     if "sentiment_score" in df.columns and "pageviews" in df.columns:
-        fig = px.scatter(df, x="sentiment_score", y="pageviews",
-                         color="publisher" if "publisher" in df.columns else None,
-                         title="News sentiment vs pageviews", opacity=0.6)
+        color = "publisher" if "publisher" in df.columns else None
+        if len(df) <= NEWS_SCATTER_MAX_POINTS:
+            fig = px.scatter(df, x="sentiment_score", y="pageviews", color=color,
+                             title="News sentiment vs pageviews", opacity=0.6)
+        else:
+            fig = px.scatter(bin_scatter(df, "sentiment_score", "pageviews", color, NEWS_SCATTER_BINS),
+                             x="sentiment_score", y="pageviews", color=color, size="count",
+                             title="News sentiment vs pageviews (binned)", opacity=0.6)
         fig.update_layout(template="plotly_white")
         return fig
     return None
 
+def bin_scatter(df: pd.DataFrame, x: str, y: str, color: Optional[str], bins: int) -> pd.DataFrame:
+    # Large scatters mostly overplot: snap points to a bins x bins grid (per color group) and
+    # send one marker per occupied cell, placed at the cell's mean and sized by its count
+    d = pd.DataFrame({x: pd.to_numeric(df[x], errors="coerce"), y: pd.to_numeric(df[y], errors="coerce")})
+    if color:
+        d[color] = df[color].astype(str)
+    d = d.dropna(subset=[x, y])
+    keys = [color] if color else []
+    for c in (x, y):
+        lo, hi = d[c].min(), d[c].max()
+        span = (hi - lo) or 1.0
+        d[f"_{c}_bin"] = np.minimum(((d[c] - lo) / span * bins).astype(np.int64), bins - 1)
+        keys.append(f"_{c}_bin")
+    g = d.groupby(keys, sort=False)
+    out = g[[x, y]].mean()
+    out["count"] = g.size()
+    return out.reset_index(level=[color] if color else []).reset_index(drop=True)
+
 def plot_reviews_hist(df: pd.DataFrame) -> Optional[go.Figure]:
     if df is None or df.empty or "rating" not in df.columns:
         return None
-    fig = px.histogram(df, x="rating", nbins=5, title="Ratings distribution")
+    fig = histogram_figure(df["rating"], 5, "Ratings distribution", x_title="rating")
     fig.update_layout(template="plotly_white")
     return fig
 
+def f32(values) -> Optional[np.ndarray]:
+    # Chart-only prices/returns: float32 halves the typed array plotly ships to the browser
+    if values is None:
+        return None
+    return pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=np.float32)
+
+def price_dates(df: pd.DataFrame) -> pd.Series:
+    # Only parse_dt_column frames carry a parsed "dt"; earnings/actions keep the raw ISO string
+    if "dt" in df.columns and pd.api.types.is_datetime64_any_dtype(df["dt"]):
+        return df["dt"]
+    return pd.to_datetime(df["date"], utc=True, errors="coerce")
+
 def plot_stock(prices_df: pd.DataFrame, earnings_df: pd.DataFrame, actions_df: pd.DataFrame, title: str) -> Optional[go.Figure]:
     if prices_df is None or prices_df.empty or "date" not in prices_df.columns or "close" not in prices_df.columns:
         return None
-    p = prices_df.copy()
-    p["date_dt"] = pd.to_datetime(p["date"], utc=True, errors="coerce")
+    # parse_dt_column already parsed "date" into "dt" for the price bars; reuse it instead of
+    # copying the frame and parsing the strings again on every chart
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=p["date_dt"], y=p["close"], mode="lines", name="Close"))
+    fig.add_trace(go.Scatter(x=price_dates(prices_df), y=f32(prices_df["close"]), mode="lines", name="Close"))
     # Events (earnings/actions)
     if earnings_df is not None and not earnings_df.empty and "date" in earnings_df.columns:
-        e = earnings_df.copy()
-        e["date_dt"] = pd.to_datetime(e["date"], utc=True, errors="coerce")
-        fig.add_trace(go.Scatter(x=e["date_dt"], y=e.get("eps_actual", None), mode="markers", name="EPS actual", marker=dict(color="#9467bd")))
+        fig.add_trace(go.Scatter(x=price_dates(earnings_df), y=f32(earnings_df.get("eps_actual", None)), mode="markers", name="EPS actual", marker=dict(color="#9467bd")))
     if actions_df is not None and not actions_df.empty and "date" in actions_df.columns:
-        a = actions_df.copy()
-        a["date_dt"] = pd.to_datetime(a["date"], utc=True, errors="coerce")
-        fig.add_trace(go.Scatter(x=a["date_dt"], y=a.get("amount", None), mode="markers", name="Actions", marker=dict(color="#8c564b")))
+        fig.add_trace(go.Scatter(x=price_dates(actions_df), y=f32(actions_df.get("amount", None)), mode="markers", name="Actions", marker=dict(color="#8c564b")))
     fig.update_layout(template="plotly_white", title=title, xaxis_title="Date", yaxis_title="Price")
     return fig
 
+def timeline_by_source(frames: List[Tuple[str, pd.DataFrame]], freq: str, value: Optional[str] = None) -> pd.DataFrame:
+    # Per-bin row count (or mean of `value`) for every source in one floor + groupby pass, instead of a
+    # copy/set_index/resample per source. Each source is then laid on its own full bin range so
+    # empty bins still show up (0 count / NaN mean), as resample does.
+    parts = []
+    for name, df in frames:
+        if df is None or df.empty or "dt" not in df.columns or (value and value not in df.columns):
+            continue
+        part = pd.DataFrame({"dt": df["dt"].dt.floor(freq), "source": name})
+        if value:
+            part[value] = pd.to_numeric(df[value], errors="coerce")
+        parts.append(part)
+    out_col = "avg" if value else "count"
+    comb = pd.concat(parts, ignore_index=True).dropna(subset=["dt"]) if parts else pd.DataFrame()
+    if comb.empty:
+        return pd.DataFrame(columns=["dt", out_col, "source"])
+    comb["source"] = pd.Categorical(comb["source"], categories=[name for name, _ in frames])
+    g = comb.groupby(["source", "dt"], observed=True, sort=True)
+    agg = g[value].mean() if value else g.size()
+    out = []
+    for name, sub in agg.groupby(level=0, observed=True, sort=False):
+        sub = sub.droplevel(0)
+        full = pd.date_range(sub.index[0], sub.index[-1], freq=freq)
+        sub = sub.reindex(full, fill_value=0) if not value else sub.reindex(full)
+        out.append(pd.DataFrame({"dt": sub.index, out_col: sub.to_numpy(), "source": name}))
+    return pd.concat(out, ignore_index=True)
+
 def plot_activity_timeline(tweets, reddit, news, reviews, freq="D") -> Optional[go.Figure]:
-    def count_by(df):
-        if df is None or df.empty or "dt" not in df.columns:
-            return pd.DataFrame(columns=["dt","count"])
-        s = df.dropna(subset=["dt"]).set_index("dt").resample(freq).size().rename("count").reset_index()
-        return s
-    t = count_by(tweets).assign(source="tweets")
-    r = count_by(reddit).assign(source="reddit")
-    n = count_by(news).assign(source="news")
-    rv = count_by(reviews).assign(source="reviews")
-    comb = pd.concat([t,r,n,rv], ignore_index=True)
+    comb = timeline_by_source([("tweets", tweets), ("reddit", reddit), ("news", news), ("reviews", reviews)], freq)
     if comb.empty:
         return None
     fig = px.line(comb, x="dt", y="count", color="source", title=f"Activity timeline ({'hourly' if freq=='H' else 'daily'})")
@@ -254,18 +339,7 @@ def plot_activity_timeline(tweets, reddit, news, reviews, freq="D") -> Optional[
     return fig
 
 def plot_sentiment_timeline(tweets, reddit, news, reviews, freq="D") -> Optional[go.Figure]:
-    def avg_sent(df):
-        if df is None or df.empty or "dt" not in df.columns:
-            return pd.DataFrame(columns=["dt","avg"])
-        if "sentiment_score" not in df.columns:
-            return pd.DataFrame(columns=["dt","avg"])
-        s = df.dropna(subset=["dt"]).set_index("dt")["sentiment_score"].resample(freq).mean().rename("avg").reset_index()
-        return s
-    t = avg_sent(tweets).assign(source="tweets")
-    r = avg_sent(reddit).assign(source="reddit")
-    n = avg_sent(news).assign(source="news")
-    rv = avg_sent(reviews).assign(source="reviews")
-    comb = pd.concat([t,r,n,rv], ignore_index=True)
+    comb = timeline_by_source([("tweets", tweets), ("reddit", reddit), ("news", news), ("reviews", reviews)], freq, value="sentiment_score")
     if comb.empty:
         return None
     fig = px.line(comb, x="dt", y="avg", color="source", title=f"Sentiment timeline ({'hourly' if freq=='H' else 'daily'})")
@@ -274,21 +348,21 @@ def plot_sentiment_timeline(tweets, reddit, news, reviews, freq="D") -> Optional
 
 def plot_buzz_vs_price(tweets, reddit, news, reviews, prices) -> Optional[go.Figure]:
     # Build daily buzz index and overlay price
+    # Days stay datetime64 (floored) rather than python date objects, so grouping and the
+    # merge hash int64 keys instead of PyObjects
     frames = []
     for name, df in [("tweets", tweets), ("reddit", reddit), ("news", news), ("reviews", reviews)]:
         if df is not None and not df.empty and "dt" in df.columns:
-            s = df.dropna(subset=["dt"]).copy()
-            s["date"] = s["dt"].dt.date
-            frames.append(s[["date"]].assign(source=name))
+            frames.append(df["dt"].dropna().dt.floor("D"))
     if not frames:
         return None
-    comb = pd.concat(frames, ignore_index=True)
-    bb = comb.groupby(["date"]).size().rename("buzz").reset_index()
-    pr = prices.copy() if prices is not None else pd.DataFrame()
+    comb = pd.concat(frames, ignore_index=True).rename("date")
+    bb = comb.to_frame().groupby(["date"]).size().rename("buzz").reset_index()
+    pr = prices if prices is not None else pd.DataFrame()
     if pr.empty or "date" not in pr.columns:
         return None
-    pr["date_dt"] = pd.to_datetime(pr["date"], utc=True, errors="coerce").dt.date
-    m = bb.merge(pr[["date_dt","close"]].rename(columns={"date_dt":"date"}), on="date", how="left")
+    pr = pd.DataFrame({"date": price_dates(pr).dt.floor("D"), "close": pr["close"]})
+    m = bb.merge(pr, on="date", how="left")
     fig = make_buzz_price_fig(m)
     return fig
 
@@ -297,7 +371,7 @@ def make_buzz_price_fig(df: pd.DataFrame) -> Optional[go.Figure]:
         return None
     fig = go.Figure()
     fig.add_trace(go.Bar(x=df["date"], y=df["buzz"], name="Buzz", marker_color="#9edae5", opacity=0.5))
-    fig.add_trace(go.Scatter(x=df["date"], y=df["close"], name="Close", yaxis="y2", line=dict(color="#1f77b4")))
+    fig.add_trace(go.Scatter(x=df["date"], y=f32(df["close"]), name="Close", yaxis="y2", line=dict(color="#1f77b4")))
     fig.update_layout(
         title="Buzz vs Price",
         yaxis=dict(title="Buzz"),
@@ -450,6 +524,8 @@ st.sidebar.checkbox("Chunked fetch (split range into N-day chunks)", key="chunk_
 st.sidebar.number_input("Chunk size (days)", min_value=1, max_value=60, step=1, key="chunk_days", disabled=not st.session_state.chunk_enabled)
 st.sidebar.number_input("Max parallel fetches", min_value=1, max_value=8, key="max_parallel_fetches", step=1)
 st.sidebar.checkbox("Include stock meta", key="include_stock_meta")
+# Raw head(100) tables are serialized to the browser on every rerun even in tabs nobody opens
+st.sidebar.checkbox("Show raw data tables", key="show_tables")
 
 # Auto-refresh
 st.sidebar.markdown("---")
@@ -668,7 +744,7 @@ with tabs[0]:
                 frames.append(df[["sentiment_label"]].assign(source=name))
         comb = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
         if not comb.empty:
-            vc = comb.groupby(["source","sentiment_label"]).size().reset_index(name="count")
+            vc = comb.groupby(["source","sentiment_label"], observed=True).size().reset_index(name="count")
             fig = px.bar(vc, x="source", y="count", color="sentiment_label", barmode="stack", title="Sentiment counts by source")
             fig.update_layout(template="plotly_white")
             st.plotly_chart(fig, use_container_width=True, key=f"sentiment_combined_{merchant}")
@@ -697,7 +773,7 @@ with tabs[2]:
         fig_tags = plot_top_hashtags(tweets_df)
         if fig_tags:
             st.plotly_chart(fig_tags, use_container_width=True, key=f"tweets_tags_{merchant}")
-        if not tweets_df.empty:
+        if st.session_state.show_tables and not tweets_df.empty:
             st.dataframe(tweets_df.head(100), use_container_width=True, key=f"tweets_table_{merchant}")
     with c2:
         st.subheader("Reddit")
@@ -707,7 +783,7 @@ with tabs[2]:
         fig_subs = plot_top_subreddits(reddit_df)
         if fig_subs:
             st.plotly_chart(fig_subs, use_container_width=True, key=f"reddit_subs_{merchant}")
-        if not reddit_df.empty:
+        if st.session_state.show_tables and not reddit_df.empty:
             st.dataframe(reddit_df.head(100), use_container_width=True, key=f"reddit_table_{merchant}")
 
 # News
@@ -719,7 +795,7 @@ with tabs[3]:
     fig_n_scatter = plot_news_scatter(news_df)
     if fig_n_scatter:
         st.plotly_chart(fig_n_scatter, use_container_width=True, key=f"news_scatter_tab_{merchant}")
-    if not news_df.empty:
+    if st.session_state.show_tables and not news_df.empty:
         st.dataframe(news_df.head(100), use_container_width=True, key=f"news_table_{merchant}")
 
 # Reviews
@@ -731,7 +807,7 @@ with tabs[4]:
     fig_rev_sent = plot_sentiment_counts(reviews_df, "Review sentiment")
     if fig_rev_sent:
         st.plotly_chart(fig_rev_sent, use_container_width=True, key=f"reviews_sent_{merchant}")
-    if not reviews_df.empty:
+    if st.session_state.show_tables and not reviews_df.empty:
         st.dataframe(reviews_df.head(100), use_container_width=True, key=f"reviews_table_{merchant}")
 
 # Stock
@@ -745,7 +821,7 @@ with tabs[5]:
             # derive return_pct if not present
             s = stock_prices_df.copy().sort_values("date")
             s["return_pct"] = s["close"].pct_change()
-            st.plotly_chart(px.histogram(s, x="return_pct", nbins=60, title="Daily return distribution").update_layout(template="plotly_white"),
+            st.plotly_chart(histogram_figure(f32(s["return_pct"]), 60, "Daily return distribution", x_title="return_pct").update_layout(template="plotly_white"),
                             use_container_width=True, key=f"stock_return_hist_{merchant}")
         if "volume" in stock_prices_df.columns:
             st.plotly_chart(px.line(stock_prices_df, x="date", y="volume", title="Daily volume").update_layout(template="plotly_white"),
@@ -774,14 +850,13 @@ with tabs[6]:
         # High-risk factors
         if "risk_factors" in wl_view.columns:
             rf = wl_view["risk_factors"].dropna()
-            factors = []
-            for lst in rf:
-                if isinstance(lst, list):
-                    factors.extend([t for t in lst if t])
-            if factors:
-                fvc = pd.Series(factors).value_counts().reset_index()
+            factors = rf[rf.map(type) == list].explode().dropna()
+            factors = factors[factors.astype(bool)]
+            if len(factors):
+                fvc = factors.value_counts().reset_index()
                 fvc.columns = ["factor","count"]
-                fig_rf = px.bar(fvc.head(20), x="factor", y="count", title="Top risk factors")
+                top = fvc.head(20)
+                fig_rf = bar_figure(top["factor"], top["count"], "Top risk factors", x_title="factor")
                 fig_rf.update_layout(template="plotly_white")
                 st.plotly_chart(fig_rf, use_container_width=True, key=f"wl_risk_factors_{merchant}")
         # Recent transactions